@@ -104,7 +104,7 @@ async def get_evaluation_summary(project_id: str):
             raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found")
 
         storage = get_storage_service()
-        results = storage.read_json(project_id, "output/results.json")
+        results = storage.read_results(project_id)
 
         if not results:
             raise HTTPException(status_code=404, detail="No results found")
@@ -24,7 +24,7 @@ async def list_workflows(project_id: str = Query(..., description="Project ID to
     try:
         if not project_service.project_exists(project_id):
             raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found")
-        sections = workflow_service.list_sections(project_id)
+        sections = await workflow_service.list_sections(project_id)
         return sections
     except HTTPException:
         raise
@@ -41,7 +41,7 @@ async def run_workflow(section_id: str, request: WorkflowRunRequest):
             raise HTTPException(status_code=404, detail=f"Project '{request.project_id}' not found")
 
         # Validate section exists in project
-        section = workflow_service.get_section(request.project_id, section_id)
+        section = await workflow_service.get_section(request.project_id, section_id)
         if not section:
             raise HTTPException(status_code=404, detail=f"Section '{section_id}' not found in project")
 
@@ -59,7 +59,7 @@ async def run_workflow(section_id: str, request: WorkflowRunRequest):
 async def get_workflow_status(section_id: str, task_id: str):
     """Get status of a running workflow"""
     try:
-        status = workflow_service.get_task_status(task_id)
+        status = await workflow_service.get_task_status(task_id)
         if not status:
             raise HTTPException(status_code=404, detail=f"Task '{task_id}' not found")
         return status
@@ -76,7 +76,7 @@ async def get_results(project_id: str):
         if not project_service.project_exists(project_id):
             raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found")
 
-        results = workflow_service.get_project_results(project_id)
+        results = await workflow_service.get_project_results(project_id)
         if not results:
             raise HTTPException(
                 status_code=404,
@@ -101,7 +101,7 @@ async def export_results(project_id: str):
             raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found")
 
         # Get results from JSON
-        results = workflow_service.get_project_results(project_id)
+        results = await workflow_service.get_project_results(project_id)
         if not results:
             raise HTTPException(
                 status_code=404,
@@ -155,7 +155,7 @@ async def export_results(project_id: str):
 async def get_section_questions(section_id: str):
     """Get questions for a specific section"""
     try:
-        questions = workflow_service.get_section_questions(section_id)
+        questions = await workflow_service.get_section_questions(section_id)
         return questions
     except HTTPException:
         raise
@@ -167,7 +167,7 @@ async def get_section_questions(section_id: str):
 async def update_section_questions(section_id: str, questions: List[dict]):
     """Update questions for a specific section"""
     try:
-        workflow_service.update_section_questions(section_id, questions)
+        await workflow_service.update_section_questions(section_id, questions)
         return {"status": "success", "message": f"Updated {len(questions)} questions for section {section_id}"}
     except HTTPException:
         raise
@@ -184,7 +184,7 @@ async def export_section_questions(section_id: str, project_id: str = Query(...,
         from fastapi.responses import StreamingResponse
 
         # Get questions from the workflow config
-        questions = workflow_service.get_section_questions(project_id, section_id)
+        questions = await workflow_service.get_section_questions(project_id, section_id)
         if questions is None:
             raise HTTPException(status_code=404, detail=f"Section '{section_id}' not found in project")
 
@@ -249,7 +249,7 @@ async def import_section_questions(
             raise HTTPException(status_code=400, detail="No valid questions found in CSV file")
 
         # Update questions in the workflow config
-        workflow_service.update_section_questions(project_id, section_id, questions)
+        await workflow_service.update_section_questions(project_id, section_id, questions)
 
         return {"status": "success", "message": f"Imported {len(questions)} questions for section {section_id}"}
     except HTTPException:
@@ -265,7 +265,7 @@ async def clear_section_answers(section_id: str, project_id: str):
         if not project_service.project_exists(project_id):
             raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found")
 
-        cleared_count = workflow_service.clear_section_answers(project_id, section_id)
+        cleared_count = await workflow_service.clear_section_answers(project_id, section_id)
         return {
             "status": "success",
             "message": f"Cleared {cleared_count} answers for section {section_id}",
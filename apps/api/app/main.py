@@ -14,6 +14,7 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from apps.api.app.api import projects, workflows, query, indexes, auth, pipeline, rollback, chat, evaluation, storage
+from apps.api.app.services.storage_service import close_storage_service
 
 
 @asynccontextmanager
@@ -24,6 +25,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("Prism API shutting down...")
+    # Close pooled async blob connections and the managed identity credential
+    await close_storage_service()
 
 
 # Create FastAPI app
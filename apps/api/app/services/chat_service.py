@@ -158,7 +158,7 @@ class ChatService:
         new_comments: Optional[str] = None
     ) -> bool:
         """
-        Update a result in the project's results.json (blob storage)
+        Update a result in the project's section results (blob storage)
 
         Args:
             project_id: Project ID
@@ -173,17 +173,13 @@ class ChatService:
         """
         try:
             storage = get_storage_service()
-            results = storage.read_json(project_id, "output/results.json")
+            section_results = storage.read_section_results(project_id, section_id)
 
-            if not results:
+            if not section_results:
                 return False
 
             # Navigate to the question
-            sections = results.get('sections', {})
-            if section_id not in sections:
-                return False
-
-            questions = sections[section_id].get('questions', {})
+            questions = section_results.get('questions', {})
             if question_id not in questions:
                 return False
 
@@ -196,7 +192,7 @@ class ChatService:
                 questions[question_id]['comments'] = new_comments
 
             # Save back to blob storage
-            storage.write_json(project_id, "output/results.json", results)
+            storage.write_section_results(project_id, section_id, section_results)
 
             return True
 
@@ -19,7 +19,8 @@ import sys
 import asyncio
 import uuid
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field
@@ -72,6 +73,51 @@ class PipelineTask:
     progress: PipelineProgress = field(default_factory=PipelineProgress)
 
 
+# Static stage metadata served by GET /pipeline/stages (read-only; callers get copies)
+PIPELINE_STAGES: Tuple[Mapping[str, Any], ...] = tuple(MappingProxyType(stage) for stage in [
+    {
+        "id": PipelineStage.PROCESS.value,
+        "name": "Extract Documents",
+        "description": "Process documents and extract content to markdown"
+    },
+    {
+        "id": PipelineStage.DEDUPLICATE.value,
+        "name": "Deduplicate",
+        "description": "Analyze and remove duplicate content"
+    },
+    {
+        "id": PipelineStage.CHUNK.value,
+        "name": "Chunk Documents",
+        "description": "Split documents into semantic chunks for RAG"
+    },
+    {
+        "id": PipelineStage.EMBED.value,
+        "name": "Generate Embeddings",
+        "description": "Create vector embeddings for chunks"
+    },
+    {
+        "id": PipelineStage.INDEX_CREATE.value,
+        "name": "Create Index",
+        "description": "Create Azure AI Search index"
+    },
+    {
+        "id": PipelineStage.INDEX_UPLOAD.value,
+        "name": "Upload to Index",
+        "description": "Upload embedded documents to search index"
+    },
+    {
+        "id": PipelineStage.SOURCE_CREATE.value,
+        "name": "Create Knowledge Source",
+        "description": "Create knowledge source wrapper for index"
+    },
+    {
+        "id": PipelineStage.AGENT_CREATE.value,
+        "name": "Create Knowledge Agent",
+        "description": "Create knowledge agent for agentic retrieval"
+    }
+])
+
+
 class PipelineService:
     """Service for managing pipeline operations with blob storage support"""
 
@@ -84,6 +130,7 @@ class PipelineService:
 
         # Task storage (in production, use Redis or database)
         self._tasks: Dict[str, PipelineTask] = {}
+        self._tasks_by_project: Dict[str, List[PipelineTask]] = {}  # index for list_tasks(project_id)
         self._lock = threading.Lock()
 
     def update_progress(self, task_id: str, current: int, total: int, message: str = "") -> None:
@@ -104,9 +151,10 @@ class PipelineService:
     def list_tasks(self, project_id: Optional[str] = None) -> List[PipelineTask]:
         """List all tasks, optionally filtered by project"""
         with self._lock:
-            tasks = list(self._tasks.values())
             if project_id:
-                tasks = [t for t in tasks if t.project_id == project_id]
+                tasks = self._tasks_by_project.get(project_id, [])
+            else:
+                tasks = self._tasks.values()
             return sorted(tasks, key=lambda t: t.started_at or datetime.min, reverse=True)
 
     def _create_task(self, project_id: str, stage: PipelineStage) -> PipelineTask:
@@ -119,6 +167,7 @@ class PipelineService:
         )
         with self._lock:
             self._tasks[task.id] = task
+            self._tasks_by_project.setdefault(project_id, []).append(task)
         return task
 
     def _update_task(self, task_id: str, **kwargs) -> None:
@@ -234,45 +283,4 @@ class PipelineService:
 
     def get_pipeline_stages(self) -> List[Dict[str, Any]]:
         """Get list of all pipeline stages with descriptions"""
-        return [
-            {
-                "id": PipelineStage.PROCESS.value,
-                "name": "Extract Documents",
-                "description": "Process documents and extract content to markdown"
-            },
-            {
-                "id": PipelineStage.DEDUPLICATE.value,
-                "name": "Deduplicate",
-                "description": "Analyze and remove duplicate content"
-            },
-            {
-                "id": PipelineStage.CHUNK.value,
-                "name": "Chunk Documents",
-                "description": "Split documents into semantic chunks for RAG"
-            },
-            {
-                "id": PipelineStage.EMBED.value,
-                "name": "Generate Embeddings",
-                "description": "Create vector embeddings for chunks"
-            },
-            {
-                "id": PipelineStage.INDEX_CREATE.value,
-                "name": "Create Index",
-                "description": "Create Azure AI Search index"
-            },
-            {
-                "id": PipelineStage.INDEX_UPLOAD.value,
-                "name": "Upload to Index",
-                "description": "Upload embedded documents to search index"
-            },
-            {
-                "id": PipelineStage.SOURCE_CREATE.value,
-                "name": "Create Knowledge Source",
-                "description": "Create knowledge source wrapper for index"
-            },
-            {
-                "id": PipelineStage.AGENT_CREATE.value,
-                "name": "Create Knowledge Agent",
-                "description": "Create knowledge agent for agentic retrieval"
-            }
-        ]
+        return [dict(stage) for stage in PIPELINE_STAGES]
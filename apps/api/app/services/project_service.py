@@ -41,15 +41,10 @@ class ProjectService:
         document_files = self.storage.list_files(project_name, "documents")
         document_count = len(document_files)
 
-        # Check output directories by listing files
-        extraction_files = self.storage.list_files(project_name, "output/extraction_results")
-        has_extraction_results = len(extraction_files) > 0
-
-        chunked_files = self.storage.list_files(project_name, "output/chunked_documents")
-        has_chunked_documents = len(chunked_files) > 0
-
-        embedded_files = self.storage.list_files(project_name, "output/embedded_documents")
-        has_embedded_documents = len(embedded_files) > 0
+        # Check output directories (only need to know if any file exists)
+        has_extraction_results = self.storage.has_files(project_name, "output/extraction_results")
+        has_chunked_documents = self.storage.has_files(project_name, "output/chunked_documents")
+        has_embedded_documents = self.storage.has_files(project_name, "output/embedded_documents")
 
         # Check for results.csv
         has_results_csv = self.storage.file_exists(project_name, "output/results.csv")
@@ -2,22 +2,39 @@
 Query Service - Handles knowledge agent queries
 """
 import os
+import re
 import sys
 from typing import Dict, List, Any, Optional
 
+# Legacy index names follow prism-{project}-index
+_INDEX_NAME_RE = re.compile(r'prism-(.+)-index')
+
+# Citation pattern: document name followed by (Page X), e.g. "Attachment 10 (Page 1)"
+_CITATION_RE = re.compile(r'([A-Za-z0-9\s\-]+?)\s*\(Page\s+(\d+)\)')
+
+_DEFAULT_BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+
+
+def _install_path_once(path: str = _DEFAULT_BASE_PATH) -> None:
+    """Add path to sys.path once so repeated services don't grow it"""
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+# Done at import time rather than per QueryService instance
+_install_path_once()
+
 
 class QueryService:
     """Service for querying knowledge agent"""
 
     def __init__(self, base_path: str = None):
         """Initialize query service"""
-        if base_path is None:
-            base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
-        self.base_path = base_path
+        self.base_path = base_path or _DEFAULT_BASE_PATH
 
-        # Add base path to sys.path if not already there
-        if base_path not in sys.path:
-            sys.path.insert(0, base_path)
+        # Only a non-default base path needs registering
+        if self.base_path != _DEFAULT_BASE_PATH:
+            _install_path_once(self.base_path)
 
     async def search_documents(self, query: str, project_id: Optional[str] = None, index_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -42,8 +59,7 @@ class QueryService:
                 os.environ['PRISM_PROJECT_NAME'] = project_id
             elif index_name:
                 # Legacy: try to extract project from index name (prism-{project}-index)
-                import re
-                match = re.match(r'prism-(.+)-index', index_name)
+                match = _INDEX_NAME_RE.match(index_name)
                 if match:
                     project_id = match.group(1)
                     print(f"[QUERY_SERVICE] Extracted project '{project_id}' from index name '{index_name}'")
@@ -88,25 +104,21 @@ class QueryService:
         query_knowledge_agent to return structured data.
         """
         citations = []
-
-        # Look for common citation patterns
-        # Example: "Attachment 10 (Page 1)"
-        import re
-
-        # Pattern: Document name followed by (Page X)
-        pattern = r'([A-Za-z0-9\s\-]+?)\s*\(Page\s+(\d+)\)'
-        matches = re.findall(pattern, response)
-
         seen = set()
-        for doc_name, page_num in matches:
-            doc_name = doc_name.strip()
+
+        # Single pass over matches; no intermediate list of tuples
+        for match in _CITATION_RE.finditer(response):
+            # Many citations share a document, so intern the name
+            doc_name = sys.intern(match.group(1).strip())
+            page_num = match.group(2)
             key = (doc_name, page_num)
-            if key not in seen:
-                citations.append({
-                    'document': doc_name,
-                    'page': int(page_num),
-                    'relevance': None  # Would need reranker scores
-                })
-                seen.add(key)
+            if key in seen:
+                continue
+            seen.add(key)
+            citations.append({
+                'document': doc_name,
+                'page': int(page_num),
+                'relevance': None  # Would need reranker scores
+            })
 
         return citations
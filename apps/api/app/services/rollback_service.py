@@ -149,6 +149,7 @@ class RollbackService:
     def _rollback_extraction(self, project_id: str) -> RollbackResult:
         """Delete extraction_results from blob storage"""
         deleted_files = self._delete_blob_directory(project_id, "output/extraction_results")
+        deleted_files += self._delete_blob_directory(project_id, "output/results")  # Workflow answers
 
         # Delete auxiliary files
         auxiliary_files = [
@@ -156,12 +157,12 @@ class RollbackService:
             "output/document_inventory.json",
             "output/deduplication_report.md",
             "output/extraction_analysis.json",
-            "output/results.json",  # Workflow answers
+            "output/results.json",  # Workflow answers (legacy single file)
         ]
 
         for file_path in auxiliary_files:
-            if self.storage.file_exists(project_id, file_path):
-                self.storage.delete_file(project_id, file_path)
+            # delete_file is False for a missing blob, so no separate exists() probe
+            if self.storage.delete_file(project_id, file_path):
                 deleted_files += 1
 
         return RollbackResult(
@@ -195,8 +196,8 @@ class RollbackService:
         ]
 
         for file_path in report_files:
-            if self.storage.file_exists(project_id, file_path):
-                self.storage.delete_file(project_id, file_path)
+            # delete_file is False for a missing blob, so no separate exists() probe
+            if self.storage.delete_file(project_id, file_path):
                 deleted_files += 1
 
         return RollbackResult(
@@ -13,24 +13,74 @@ All project data stored in Azure Blob Storage:
                 extraction_results/
                 chunked_documents/
                 embedded_documents/
-                results.json
+                results/{section_id}.json   (workflow answers, one blob per section)
+                results.json                (legacy single-file answers, read-only)
             config.json
             workflow_config.json
 """
 
 import os
-import json
-from typing import List, Dict, Any, Optional
+import io
+import asyncio
+import heapq
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from datetime import datetime
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
-from azure.core.exceptions import ResourceNotFoundError, ResourceExistsError, HttpResponseError
+from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+from azure.storage.blob import BlobServiceClient, BlobPrefix, BlobType
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient, ContainerClient as AsyncContainerClient
+from azure.core import MatchConditions
+from azure.core.exceptions import (
+    ResourceNotFoundError, ResourceExistsError, ResourceModifiedError, HttpResponseError
+)
 
 from scripts.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# HTTP connection pool size for blob operations (SDK default of 10 caps parallel work)
+STORAGE_POOL_SIZE = int(os.getenv("PRISM_STORAGE_POOL_SIZE", "64"))
+
+# Parallel block uploads per write (large extraction/embedding JSON)
+UPLOAD_CONCURRENCY = int(os.getenv("PRISM_STORAGE_UPLOAD_CONCURRENCY", "4"))
+
+# Workflow answers live in one blob per section ({"name", "questions"}) so saving an
+# answer rewrites only its section. Projects from before the split still have a single
+# results.json ({"sections": {...}}); it is read as a base that section blobs override.
+RESULTS_DIR = "output/results"
+LEGACY_RESULTS_PATH = "output/results.json"
+
+
+def _build_transport() -> RequestsTransport:
+    """Build a shared HTTP transport with a connection pool sized for parallel blob calls."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=STORAGE_POOL_SIZE, pool_maxsize=STORAGE_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)  # Azurite
+    return RequestsTransport(session=session, session_owner=False, connection_timeout=30, read_timeout=60)
+
+
+def _build_async_transport():
+    """asyncio counterpart of _build_transport; must be called on the event loop that will use it."""
+    # aiohttp is only installed for the API (requirements-api.txt), so import on first async use
+    import aiohttp
+    from azure.core.pipeline.transport import AioHttpTransport
+
+    connector = aiohttp.TCPConnector(limit=STORAGE_POOL_SIZE, limit_per_host=STORAGE_POOL_SIZE)
+    # session_owner=True: closing the blob client closes the session and its connections
+    return AioHttpTransport(
+        session=aiohttp.ClientSession(connector=connector),
+        session_owner=True,
+        connection_timeout=30,
+        read_timeout=60
+    )
+
 
 class StorageService:
     """Azure Blob Storage service."""
@@ -41,11 +91,25 @@ class StorageService:
         # Check for connection string (Azurite / local dev)
         connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING", "").strip()
 
+        # One pooled transport shared by every blob/container client
+        transport = _build_transport()
+
+        # Kept so the asyncio client can be built lazily on the event loop
+        self._connection_string = connection_string
+        self._account_url: Optional[str] = None
+        self._async_service_client: Optional[AsyncBlobServiceClient] = None
+        self._async_credential: Optional[AsyncDefaultAzureCredential] = None
+        self._async_container_client: Optional[AsyncContainerClient] = None
+
+        # Workflow result blobs from the last aread_results, keyed by project:
+        # {project_name: {relative_path: (etag, orjson bytes)}}
+        self._results_cache: Dict[str, Dict[str, Tuple[str, bytes]]] = {}
+
         if connection_string:
             # Local development with Azurite
             self.account_name = "devstoreaccount1"
             logger.info("Using Azurite (connection string)")
-            self._blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+            self._blob_service_client = BlobServiceClient.from_connection_string(connection_string, transport=transport)
         else:
             # Azure with DefaultAzureCredential (Managed Identity)
             self.account_name = os.getenv("AZURE_STORAGE_ACCOUNT_NAME")
@@ -53,9 +117,10 @@ class StorageService:
                 raise ValueError("AZURE_STORAGE_ACCOUNT_NAME or AZURE_STORAGE_CONNECTION_STRING must be set")
 
             account_url = f"https://{self.account_name}.blob.core.windows.net"
+            self._account_url = account_url
             logger.info("Using DefaultAzureCredential (Managed Identity)")
             credential = DefaultAzureCredential()
-            self._blob_service_client = BlobServiceClient(account_url, credential=credential)
+            self._blob_service_client = BlobServiceClient(account_url, credential=credential, transport=transport)
 
         self._container_client = self._blob_service_client.get_container_client(self.container_name)
 
@@ -131,11 +196,48 @@ class StorageService:
             logger.error(f"Failed to read {relative_path}: {e}")
             return None
 
+    def read_file_range(self, project_name: str, relative_path: str, offset: int, length: int) -> Optional[bytes]:
+        """Read a byte range of a file (e.g. a prefix) without downloading the rest."""
+        try:
+            blob_client = self._container_client.get_blob_client(f"{project_name}/{relative_path}")
+            return blob_client.download_blob(offset=offset, length=length).readall()
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read {relative_path}: {e}")
+            return None
+
+    def iter_file_chunks(self, project_name: str, relative_path: str) -> Optional[Iterator[bytes]]:
+        """
+        Stream a file as it downloads instead of buffering it whole.
+
+        Chunk sizes follow the SDK's download settings (first range up to
+        max_single_get_size, then max_chunk_get_size).
+
+        Returns:
+            Iterator of byte chunks, or None if the file doesn't exist
+        """
+        try:
+            blob_client = self._container_client.get_blob_client(f"{project_name}/{relative_path}")
+            return blob_client.download_blob().chunks()
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read {relative_path}: {e}")
+            return None
+
     def write_file(self, project_name: str, relative_path: str, content: bytes) -> bool:
         """Write a file."""
         try:
             blob_client = self._container_client.get_blob_client(f"{project_name}/{relative_path}")
-            blob_client.upload_blob(content, overwrite=True)
+            # Stream from a buffer so the SDK can chunk and upload blocks in parallel
+            blob_client.upload_blob(
+                io.BytesIO(content),
+                overwrite=True,
+                length=len(content),
+                max_concurrency=UPLOAD_CONCURRENCY,
+                blob_type=BlobType.BLOCKBLOB
+            )
             return True
         except Exception as e:
             logger.error(f"Failed to write {relative_path}: {e}")
@@ -157,19 +259,32 @@ class StorageService:
         blob_client = self._container_client.get_blob_client(f"{project_name}/{relative_path}")
         return blob_client.exists()
 
-    def list_files(self, project_name: str, prefix: str = "", recursive: bool = True) -> List[Dict[str, Any]]:
+    def get_etag(self, project_name: str, relative_path: str) -> Optional[str]:
         """
-        List files in a directory.
+        Get a file's ETag without downloading it.
 
-        Args:
-            project_name: Project name
-            prefix: Directory prefix (e.g., "output/extraction_results")
-            recursive: If True, include files in subdirectories
+        Returns None only if the file is missing; other errors propagate, so a
+        transient failure is never mistaken for "does not exist".
+        """
+        try:
+            blob_client = self._container_client.get_blob_client(f"{project_name}/{relative_path}")
+            return blob_client.get_blob_properties().etag
+        except ResourceNotFoundError:
+            return None
 
-        Returns:
-            List of file info dicts with 'name', 'path' (project-relative), 'size', 'modified'
+    def _iter_files(
+        self,
+        project_name: str,
+        prefix: str = "",
+        recursive: bool = True,
+        **list_kwargs
+    ) -> Iterator[Tuple[Any, str, str]]:
+        """
+        Yield (blob, project-relative path, filename) for the files under a prefix.
+
+        Placeholders, hidden files and directory markers are skipped. Blobs are
+        fetched lazily page by page, so a caller that stops early stops listing.
         """
-        files = []
         # Build blob prefix
         if prefix:
             # Remove trailing slash if present, we'll add it
@@ -179,9 +294,17 @@ class StorageService:
             blob_prefix = f"{project_name}/"
 
         project_prefix = f"{project_name}/"
-        blobs = self._container_client.list_blobs(name_starts_with=blob_prefix)
+        if recursive:
+            blobs = self._container_client.list_blobs(name_starts_with=blob_prefix, **list_kwargs)
+        else:
+            # Let the service return only immediate children instead of the whole subtree
+            blobs = self._container_client.walk_blobs(name_starts_with=blob_prefix, delimiter='/', **list_kwargs)
 
         for blob in blobs:
+            # walk_blobs yields BlobPrefix entries for subdirectories
+            if isinstance(blob, BlobPrefix):
+                continue
+
             if blob.name.endswith('.placeholder'):
                 continue
 
@@ -190,41 +313,376 @@ class StorageService:
             if not project_relative_path or project_relative_path.endswith('/'):
                 continue
 
-            # Get path relative to the prefix for subdirectory check
-            prefix_relative_path = blob.name[len(blob_prefix):]
-
-            # Skip subdirectories if not recursive
-            if not recursive and '/' in prefix_relative_path:
-                continue
-
-            filename = os.path.basename(project_relative_path)
+            _, _, filename = project_relative_path.rpartition('/')
             if filename.startswith('.'):
                 continue
 
-            files.append({
+            yield blob, project_relative_path, filename
+
+    def list_files(
+        self,
+        project_name: str,
+        prefix: str = "",
+        recursive: bool = True,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List files in a directory.
+
+        Args:
+            project_name: Project name
+            prefix: Directory prefix (e.g., "output/extraction_results")
+            recursive: If True, include files in subdirectories
+            limit: If set, return only the first N files by name. Only N entries are
+                kept while the listing streams, but every blob under the prefix is still
+                listed (use has_files to test for any file)
+
+        Returns:
+            List of file info dicts with 'name', 'path' (project-relative), 'size', 'modified'
+        """
+        files = (
+            {
                 "name": filename,
                 "path": project_relative_path,  # Full path relative to project
                 "size": blob.size,
                 "modified": blob.last_modified.isoformat() if blob.last_modified else None
-            })
+            }
+            for blob, project_relative_path, filename in self._iter_files(project_name, prefix, recursive)
+        )
+
+        if limit is not None:
+            return heapq.nsmallest(limit, files, key=itemgetter("name"))
+        return sorted(files, key=itemgetter("name"))
 
-        return sorted(files, key=lambda f: f["name"])
+    def has_files(self, project_name: str, prefix: str = "") -> bool:
+        """Check whether any file exists under a prefix, stopping at the first one."""
+        # One blob per page, so the listing ends as soon as a real file turns up
+        return next(self._iter_files(project_name, prefix, results_per_page=1), None) is not None
+
+    def _parse_json(self, content: bytes, relative_path: str) -> Optional[Dict]:
+        """Decode JSON file content, logging rather than raising on bad data."""
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON {relative_path}: {e}")
+            return None
 
     def read_json(self, project_name: str, relative_path: str) -> Optional[Dict]:
         """Read JSON file."""
         content = self.read_file(project_name, relative_path)
         if content is None:
             return None
+        return self._parse_json(content, relative_path)
+
+    def read_json_with_etag(self, project_name: str, relative_path: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Read JSON file along with the ETag of the version that was read.
+
+        Returns (None, None) only if the file is missing; other errors propagate,
+        since callers use a missing ETag to create the file (IfMissing).
+        """
         try:
-            return json.loads(content.decode('utf-8'))
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON {relative_path}: {e}")
-            return None
+            blob_client = self._container_client.get_blob_client(f"{project_name}/{relative_path}")
+            downloader = blob_client.download_blob()
+            content = downloader.readall()
+            etag = downloader.properties.etag
+        except ResourceNotFoundError:
+            return None, None
+        return self._parse_json(content, relative_path), etag
+
+    def _dump_json(self, data: Dict, indent: bool = True) -> bytes:
+        """Serialize data to the on-disk JSON format (compact when indent is False)."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
 
     def write_json(self, project_name: str, relative_path: str, data: Dict) -> bool:
         """Write JSON file."""
-        content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
-        return self.write_file(project_name, relative_path, content)
+        return self.write_file(project_name, relative_path, self._dump_json(data))
+
+    def write_json_if_match(
+        self,
+        project_name: str,
+        relative_path: str,
+        data: Dict,
+        etag: Optional[str],
+        indent: bool = True
+    ) -> Optional[str]:
+        """
+        Write JSON file only if it is unchanged since it was read (optimistic concurrency).
+
+        Args:
+            project_name: Project name
+            relative_path: Project-relative path
+            data: JSON-serializable data
+            etag: ETag of the version read, or None if the file must not exist yet
+            indent: Pretty-print the JSON; pass False for compact, machine-only files
+
+        Returns:
+            New ETag, or None if the write failed
+
+        Raises:
+            ResourceModifiedError / ResourceExistsError: another writer changed the file
+        """
+        content = self._dump_json(data, indent)
+        if etag:
+            conditions = {"etag": etag, "match_condition": MatchConditions.IfNotModified}
+        else:
+            conditions = {"match_condition": MatchConditions.IfMissing}
+
+        try:
+            blob_client = self._container_client.get_blob_client(f"{project_name}/{relative_path}")
+            response = blob_client.upload_blob(
+                io.BytesIO(content),
+                overwrite=True,
+                length=len(content),
+                max_concurrency=UPLOAD_CONCURRENCY,
+                blob_type=BlobType.BLOCKBLOB,
+                **conditions
+            )
+            return response.get("etag")
+        except (ResourceModifiedError, ResourceExistsError):
+            raise
+        except Exception as e:
+            logger.error(f"Failed to write {relative_path}: {e}")
+            return None
+
+    # Workflow results (per-section blobs over the legacy results.json)
+
+    @staticmethod
+    def section_results_path(section_id: str) -> str:
+        """Project-relative path of a section's results blob."""
+        return f"{RESULTS_DIR}/{section_id}.json"
+
+    @staticmethod
+    def _merge_results(legacy: Optional[Dict], section_results: Dict[str, Dict]) -> Optional[Dict]:
+        """Overlay per-section results on the legacy results document."""
+        if legacy is None and not section_results:
+            return None
+        sections = dict((legacy or {}).get("sections", {}))
+        sections.update(section_results)
+        return {"sections": sections}
+
+    def read_section_results(self, project_name: str, section_id: str) -> Optional[Dict]:
+        """
+        Read one section's results.
+
+        Returns:
+            {"name": ..., "questions": {...}}, or None if the section has no results
+        """
+        data = self.read_json(project_name, self.section_results_path(section_id))
+        if data is not None:
+            return data
+        # Not written since the split; fall back to the legacy file
+        legacy = self.read_json(project_name, LEGACY_RESULTS_PATH)
+        return (legacy or {}).get("sections", {}).get(section_id)
+
+    def write_section_results(self, project_name: str, section_id: str, data: Dict) -> bool:
+        """Write one section's results."""
+        return self.write_json(project_name, self.section_results_path(section_id), data)
+
+    def read_results(self, project_name: str) -> Optional[Dict]:
+        """
+        Read all workflow results.
+
+        Returns:
+            {"sections": {section_id: {...}}}, or None if the project has no results
+        """
+        section_results = {}
+        for f in self.list_files(project_name, RESULTS_DIR, recursive=False):
+            section_id, ext = os.path.splitext(f["name"])
+            if ext != ".json":
+                continue
+            data = self.read_json(project_name, f["path"])
+            if data is not None:
+                section_results[section_id] = data
+        return self._merge_results(self.read_json(project_name, LEGACY_RESULTS_PATH), section_results)
+
+    # Async API for code running on the event loop (FastAPI handlers, workflows)
+
+    def _get_async_container_client(self) -> AsyncContainerClient:
+        """Get the asyncio container client, creating it on first use (closed by aclose)."""
+        if self._async_container_client is None:
+            transport = _build_async_transport()
+            if self._connection_string:
+                service = AsyncBlobServiceClient.from_connection_string(self._connection_string, transport=transport)
+            else:
+                self._async_credential = AsyncDefaultAzureCredential()
+                service = AsyncBlobServiceClient(self._account_url, credential=self._async_credential, transport=transport)
+            self._async_service_client = service
+            self._async_container_client = service.get_container_client(self.container_name)
+        return self._async_container_client
+
+    async def aclose(self) -> None:
+        """Close the asyncio client, its connection pool and credential (safe to call repeatedly)."""
+        service, credential = self._async_service_client, self._async_credential
+        self._async_service_client = self._async_credential = self._async_container_client = None
+        if service is not None:
+            await service.close()
+        if credential is not None:
+            await credential.close()
+
+    async def aread_file(self, project_name: str, relative_path: str) -> Optional[bytes]:
+        """Read a file without blocking the event loop."""
+        try:
+            blob_client = self._get_async_container_client().get_blob_client(f"{project_name}/{relative_path}")
+            downloader = await blob_client.download_blob()
+            return await downloader.readall()
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read {relative_path}: {e}")
+            return None
+
+    async def awrite_file(self, project_name: str, relative_path: str, content: bytes) -> bool:
+        """Write a file without blocking the event loop."""
+        try:
+            blob_client = self._get_async_container_client().get_blob_client(f"{project_name}/{relative_path}")
+            await blob_client.upload_blob(
+                io.BytesIO(content),
+                overwrite=True,
+                length=len(content),
+                max_concurrency=UPLOAD_CONCURRENCY,
+                blob_type=BlobType.BLOCKBLOB
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write {relative_path}: {e}")
+            return False
+
+    async def aget_etag(self, project_name: str, relative_path: str) -> Optional[str]:
+        """Async get_etag (None only if missing; other errors propagate)."""
+        try:
+            blob_client = self._get_async_container_client().get_blob_client(f"{project_name}/{relative_path}")
+            return (await blob_client.get_blob_properties()).etag
+        except ResourceNotFoundError:
+            return None
+
+    async def aread_json(self, project_name: str, relative_path: str) -> Optional[Dict]:
+        """Async read_json."""
+        content = await self.aread_file(project_name, relative_path)
+        if content is None:
+            return None
+        return self._parse_json(content, relative_path)
+
+    async def aread_json_with_etag(self, project_name: str, relative_path: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Async read_json_with_etag ((None, None) only if missing; other errors propagate)."""
+        try:
+            blob_client = self._get_async_container_client().get_blob_client(f"{project_name}/{relative_path}")
+            downloader = await blob_client.download_blob()
+            content = await downloader.readall()
+            etag = downloader.properties.etag
+        except ResourceNotFoundError:
+            return None, None
+        return self._parse_json(content, relative_path), etag
+
+    async def awrite_json(self, project_name: str, relative_path: str, data: Dict) -> bool:
+        """Async write_json."""
+        return await self.awrite_file(project_name, relative_path, self._dump_json(data))
+
+    async def awrite_json_if_match(
+        self,
+        project_name: str,
+        relative_path: str,
+        data: Dict,
+        etag: Optional[str],
+        indent: bool = True
+    ) -> Optional[str]:
+        """Async write_json_if_match (same conflict semantics)."""
+        content = self._dump_json(data, indent)
+        if etag:
+            conditions = {"etag": etag, "match_condition": MatchConditions.IfNotModified}
+        else:
+            conditions = {"match_condition": MatchConditions.IfMissing}
+
+        try:
+            blob_client = self._get_async_container_client().get_blob_client(f"{project_name}/{relative_path}")
+            response = await blob_client.upload_blob(
+                io.BytesIO(content),
+                overwrite=True,
+                length=len(content),
+                max_concurrency=UPLOAD_CONCURRENCY,
+                blob_type=BlobType.BLOCKBLOB,
+                **conditions
+            )
+            return response.get("etag")
+        except (ResourceModifiedError, ResourceExistsError):
+            raise
+        except Exception as e:
+            logger.error(f"Failed to write {relative_path}: {e}")
+            return None
+
+    async def aread_section_results(self, project_name: str, section_id: str) -> Optional[Dict]:
+        """Async read_section_results."""
+        data = await self.aread_json(project_name, self.section_results_path(section_id))
+        if data is not None:
+            return data
+        legacy = await self.aread_json(project_name, LEGACY_RESULTS_PATH)
+        return (legacy or {}).get("sections", {}).get(section_id)
+
+    async def awrite_section_results(self, project_name: str, section_id: str, data: Dict) -> bool:
+        """Async write_section_results."""
+        return await self.awrite_json(project_name, self.section_results_path(section_id), data)
+
+    async def aget_results_etags(self, project_name: str) -> Optional[Tuple[Tuple[str, str], ...]]:
+        """
+        Version stamp for all workflow results, from one listing (no downloads).
+
+        Returns:
+            Sorted (path, etag) pairs for the legacy file and section blobs,
+            or None if the listing failed
+        """
+        project_prefix = f"{project_name}/"
+        try:
+            container = self._get_async_container_client()
+            # The "output/results" prefix matches both results.json and results/
+            listed = [
+                (blob.name[len(project_prefix):], blob.etag)
+                async for blob in container.list_blobs(name_starts_with=f"{project_prefix}{RESULTS_DIR}")
+            ]
+        except Exception as e:
+            logger.error(f"Failed to list {RESULTS_DIR}: {e}")
+            return None
+        return tuple(sorted(
+            (path, etag) for path, etag in listed
+            if path == LEGACY_RESULTS_PATH or (path.startswith(f"{RESULTS_DIR}/") and path.endswith(".json"))
+        ))
+
+    async def aread_results(self, project_name: str) -> Optional[Dict]:
+        """
+        Async read_results; only result blobs changed since the last read are downloaded.
+
+        One listing gives every result blob's ETag. Blobs whose ETag matches the
+        cached copy are served from memory, the rest are fetched concurrently.
+        If the listing fails, falls back to an uncached read_results rather
+        than returning a partial view.
+        """
+        stamps = await self.aget_results_etags(project_name)
+        if stamps is None:
+            return await asyncio.to_thread(self.read_results, project_name)
+
+        listed = dict(stamps)
+        cached = self._results_cache.get(project_name, {})
+        stale = [path for path, etag in stamps if cached.get(path, (None,))[0] != etag]
+        fetched = await asyncio.gather(*(self.aread_json_with_etag(project_name, path) for path in stale))
+
+        # Rebuilt from the listing, so blobs deleted since the last read drop out
+        entries = {path: cached[path] for path in listed if path not in stale}
+        for path, (data, _) in zip(stale, fetched):
+            if data is not None:
+                # Keyed by the listing's ETag, not the download's: the two are formatted
+                # differently (the download header is quoted), so only this one compares
+                # equal on the next listing. A blob rewritten in between just refetches.
+                entries[path] = (listed[path], orjson.dumps(data))
+        self._results_cache[project_name] = entries
+
+        # Callers mutate results, so each gets a fresh parse
+        legacy = orjson.loads(entries[LEGACY_RESULTS_PATH][1]) if LEGACY_RESULTS_PATH in entries else None
+        section_results = {
+            os.path.splitext(os.path.basename(path))[0]: orjson.loads(content)
+            for path, (_, content) in entries.items()
+            if path != LEGACY_RESULTS_PATH
+        }
+        return self._merge_results(legacy, section_results)
 
 
 # Singleton
@@ -237,3 +695,9 @@ def get_storage_service() -> StorageService:
     if _storage_service is None:
         _storage_service = StorageService()
     return _storage_service
+
+
+async def close_storage_service() -> None:
+    """Release the singleton's asyncio resources on app shutdown (no-op if never created)."""
+    if _storage_service is not None:
+        await _storage_service.aclose()
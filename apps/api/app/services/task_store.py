@@ -0,0 +1,98 @@
+"""
+Task Store - Workflow task state shared across API workers
+
+Backends:
+- Redis (REDIS_URL set): one hash per task (task:{id}), expiring after a day,
+  so any uvicorn worker can report status for a task started on another
+- In-process dict (default): single-worker local development
+
+Field values are JSON-encoded so None/int/str round-trip through Redis.
+"""
+
+import os
+import json
+from typing import Dict, Any, Optional
+
+from scripts.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds to keep a finished task's status around in Redis
+TASK_TTL_SECONDS = 86400
+
+
+class TaskStore:
+    """Async key/value store for workflow task info."""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self._redis = None
+        # In-memory backend; updates never await, so no lock is needed on the event loop
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+
+        if redis_url:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(redis_url, decode_responses=True)
+            logger.info("Task store: Redis")
+        else:
+            logger.info("Task store: in-memory (single worker only)")
+
+    @staticmethod
+    def _key(task_id: str) -> str:
+        return f"task:{task_id}"
+
+    async def create(self, task_id: str, task_info: Dict[str, Any]) -> None:
+        """Store a new task."""
+        if self._redis is None:
+            self._tasks[task_id] = dict(task_info)
+            return
+
+        key = self._key(task_id)
+        mapping = {k: json.dumps(v) for k, v in task_info.items()}
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, TASK_TTL_SECONDS)
+            await pipe.execute()
+
+    async def update(self, task_id: str, **fields: Any) -> None:
+        """Set one or more fields on an existing task."""
+        if self._redis is None:
+            if task_id in self._tasks:
+                self._tasks[task_id].update(fields)
+            return
+
+        mapping = {k: json.dumps(v) for k, v in fields.items()}
+        await self._redis.hset(self._key(task_id), mapping=mapping)
+
+    async def incr(self, task_id: str, field: str, amount: int = 1) -> int:
+        """Atomically increment an integer field."""
+        if self._redis is None:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return 0
+            task[field] = task.get(field, 0) + amount
+            return task[field]
+
+        return await self._redis.hincrby(self._key(task_id), field, amount)
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get task info, or None if unknown/expired."""
+        if self._redis is None:
+            task = self._tasks.get(task_id)
+            return dict(task) if task else None
+
+        raw = await self._redis.hgetall(self._key(task_id))
+        if not raw:
+            return None
+        return {k: json.loads(v) for k, v in raw.items()}
+
+
+# Singleton
+_task_store: Optional[TaskStore] = None
+
+
+def get_task_store() -> TaskStore:
+    """Get task store singleton."""
+    global _task_store
+    if _task_store is None:
+        _task_store = TaskStore(os.getenv("REDIS_URL", "").strip() or None)
+    return _task_store
@@ -11,76 +11,245 @@ This service handles:
 """
 import os
 import asyncio
+import orjson
+import threading
 import uuid
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from datetime import datetime
+from azure.core.exceptions import ResourceModifiedError, ResourceExistsError
 from apps.api.app.models import (
     WorkflowSection, WorkflowRunResponse, WorkflowStatusResponse,
     TaskStatus, QuestionResult, ProjectResults
 )
 from apps.api.app.services.storage_service import get_storage_service
+from apps.api.app.services.task_store import get_task_store
+from scripts.logging_config import get_logger
+from scripts.project_context import PROJECT_NAME
+
+logger = get_logger(__name__)
+
+# Derived lookup tables kept alongside a loaded config, never persisted
+_INDEX_KEYS = ("_section_index", "_question_index")
+
+# Attempts for a workflow_config.json read-modify-write that loses an ETag race
+CONFIG_WRITE_RETRIES = 3
+
+# Workflows allowed to run at once per process; extra runs wait their turn
+MAX_CONCURRENT_WORKFLOWS = int(os.getenv("PRISM_MAX_CONCURRENT_WORKFLOWS", "4"))
+
+# Shared read-only default for missing results entries
+_EMPTY: Dict[str, Any] = {}
+
+
+def _question_result(question: Dict[str, Any], q_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape one question and its stored result for ProjectResults"""
+    return {
+        "question_id": question.get("id", ""),
+        "question_name": question.get("question", ""),
+        "answer": q_result.get("answer") or None,
+        "reference": q_result.get("reference") or None,
+        "comments": q_result.get("comments") or None,
+        "evaluation": q_result.get("evaluation", None)
+    }
+
+
+def _section_result(section: Dict[str, Any], section_results: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape one config section and its stored results for ProjectResults"""
+    questions_results = section_results.get("questions", _EMPTY)
+    return {
+        "section_id": section.get("id", ""),
+        "section_name": section.get("name", "Unnamed"),
+        "questions": [
+            _question_result(q, questions_results.get(q.get("id", ""), _EMPTY))
+            for q in section.get("questions", [])
+        ]
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_factory_cls():
+    """Import WorkflowAgentFactory on first use (pulls in the agent framework and Azure SDKs)"""
+    from workflows.workflow_agent import WorkflowAgentFactory
+    return WorkflowAgentFactory
 
 
 class WorkflowService:
     """Service for workflow management using StorageService backend"""
 
-    # Track running tasks in memory (in production, use Redis or database)
-    _tasks: Dict[str, Dict[str, Any]] = {}
+    # Shared by every instance so the cap holds process-wide
+    _run_sem = asyncio.Semaphore(MAX_CONCURRENT_WORKFLOWS)
 
     def __init__(self):
         """Initialize workflow service with storage backend"""
         self.storage = get_storage_service()
 
-    def _get_workflow_config(self, project_id: str) -> Dict:
+        # Task status lives in Redis when configured so any worker can report it
+        self._task_store = get_task_store()
+
+        # Serialized workflow configs keyed by project: {project_id: (etag, orjson bytes)}
+        self._config_cache: Dict[str, Tuple[str, bytes]] = {}
+        self._config_lock = threading.Lock()
+
+        # Per-section (question_count, completed_count) keyed by project:
+        # {project_id: ((config etag, results etags), counts)}
+        self._counts_cache: Dict[str, Tuple[Tuple, List[Tuple[int, int]]]] = {}
+
+    async def _load_workflow_config(self, project_id: str) -> Tuple[Dict, Optional[str]]:
+        """
+        Load workflow config and its ETag (cached, revalidated by ETag).
+
+        A missing config reads as empty with a None ETag, so the next save creates
+        it. Any other storage error propagates rather than looking like "missing".
+        """
+        with self._config_lock:
+            cached = self._config_cache.get(project_id)
+        if cached:
+            etag = await self.storage.aget_etag(project_id, "workflow_config.json")
+            if etag is None:
+                with self._config_lock:
+                    self._config_cache.pop(project_id, None)
+                return self._index_config({"sections": []}), None
+            if cached[0] == etag:
+                # Callers mutate the config, so each gets a fresh parse (much cheaper than deepcopy)
+                return self._index_config(orjson.loads(cached[1])), etag
+
+        # Nothing to revalidate: download straight away (only a missing blob reads as None)
+        config, etag = await self.storage.aread_json_with_etag(project_id, "workflow_config.json")
+        if not config:
+            return self._index_config({"sections": []}), etag
+
+        with self._config_lock:
+            self._config_cache[project_id] = (etag, orjson.dumps(config))
+        return self._index_config(config), etag
+
+    async def _get_workflow_config(self, project_id: str) -> Dict:
         """Load workflow config for a project"""
-        config = self.storage.read_json(project_id, "workflow_config.json")
-        return config if config else {"sections": []}
+        return (await self._load_workflow_config(project_id))[0]
+
+    async def _save_workflow_config(self, project_id: str, config: Dict, etag: Optional[str]) -> bool:
+        """
+        Save workflow config only if it is unchanged since `etag` was read.
+
+        Raises ResourceModifiedError/ResourceExistsError if another writer got there first.
+        """
+        with self._config_lock:
+            self._config_cache.pop(project_id, None)
+        data = {k: v for k, v in config.items() if k not in _INDEX_KEYS}
+        # Compact JSON: the config is only read back by code, and is about half the bytes
+        new_etag = await self.storage.awrite_json_if_match(
+            project_id, "workflow_config.json", data, etag, indent=False
+        )
+        if new_etag is None:
+            return False
+
+        # Seed the cache with what was just written so the next read skips the download
+        with self._config_lock:
+            self._config_cache[project_id] = (new_etag, orjson.dumps(data))
+        return True
+
+    async def _update_workflow_config(self, project_id: str, apply: Callable[[Dict], Any]) -> Any:
+        """
+        Read-modify-write the workflow config with optimistic concurrency.
+
+        `apply` mutates the config in place and returns the value to hand back,
+        or None if there is nothing to change. On a concurrent edit the config is
+        re-read and `apply` re-run, up to CONFIG_WRITE_RETRIES times.
+
+        Returns the value from `apply`, or None if nothing changed or the save failed.
+        """
+        for attempt in range(1, CONFIG_WRITE_RETRIES + 1):
+            config, etag = await self._load_workflow_config(project_id)
+            result = apply(config)
+            if result is None:
+                return None
+            try:
+                return result if await self._save_workflow_config(project_id, config, etag) else None
+            except (ResourceModifiedError, ResourceExistsError):
+                logger.warning(
+                    f"workflow_config.json for {project_id} changed concurrently "
+                    f"(attempt {attempt}/{CONFIG_WRITE_RETRIES}), retrying"
+                )
+
+        logger.error(f"Gave up saving workflow_config.json for {project_id} after {CONFIG_WRITE_RETRIES} conflicts")
+        return None
 
-    def _save_workflow_config(self, project_id: str, config: Dict) -> bool:
-        """Save workflow config for a project"""
-        return self.storage.write_json(project_id, "workflow_config.json", config)
+    @staticmethod
+    def _index_config(config: Dict) -> Dict:
+        """Attach section/question lookup indexes to a loaded config (stripped on save)"""
+        section_index: Dict[str, int] = {}
+        question_index: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        for i, section in enumerate(config.get("sections", [])):
+            section_id = section.get("id")
+            # First match wins, as with the previous linear scans
+            section_index.setdefault(section_id, i)
+            for j, q in enumerate(section.get("questions", [])):
+                question_index.setdefault((section_id, q.get("id")), (i, j))
+        config["_section_index"] = section_index
+        config["_question_index"] = question_index
+        return config
+
+    @staticmethod
+    def _find_section(config: Dict, section_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a section by ID using the config's index"""
+        idx = config["_section_index"].get(section_id)
+        if idx is None:
+            return None
+        return config["sections"][idx]
 
-    def _get_results(self, project_id: str) -> Dict:
-        """Load results for a project"""
-        results = self.storage.read_json(project_id, "output/results.json")
+    async def _get_results(self, project_id: str) -> Dict:
+        """Load results for a project (all sections)"""
+        results = await self.storage.aread_results(project_id)
         return results if results else {"sections": {}}
 
-    def _save_results(self, project_id: str, results: Dict) -> bool:
-        """Save results for a project"""
-        return self.storage.write_json(project_id, "output/results.json", results)
-
-    def list_sections(self, project_id: str) -> List[WorkflowSection]:
-        """List all workflow sections with completion status"""
-        config = self._get_workflow_config(project_id)
-        results = self._get_results(project_id)
-
-        sections = []
-
+    @staticmethod
+    def _section_counts(config: Dict, results: Dict) -> List[Tuple[int, int]]:
+        """(question_count, completed_count) for each section in config order"""
+        counts = []
         for section in config.get("sections", []):
-            section_id = section.get("id", "")
-            section_name = section.get("name", "Unnamed Section")
             questions = section.get("questions", [])
-            question_count = len(questions)
 
             # Count completed questions from results
-            completed_count = 0
-            section_results = results.get("sections", {}).get(section_id, {})
-            questions_results = section_results.get("questions", {})
+            section_results = results.get("sections", {}).get(section.get("id", ""), {})
+            answered = {
+                q_id
+                for q_id, q_result in section_results.get("questions", {}).items()
+                if (answer := (q_result.get("answer") or "").strip()) and answer != "N/A"
+            }
+            completed_count = sum(1 for q in questions if q.get("id", "") in answered)
+            counts.append((len(questions), completed_count))
+        return counts
 
-            for q in questions:
-                q_id = q.get("id", "")
-                if q_id in questions_results:
-                    answer = questions_results[q_id].get("answer", "")
-                    if answer and answer.strip() and answer.strip() != "N/A":
-                        completed_count += 1
+    async def list_sections(self, project_id: str) -> List[WorkflowSection]:
+        """List all workflow sections with completion status"""
+        (config, config_etag), results_etags = await asyncio.gather(
+            self._load_workflow_config(project_id),
+            self.storage.aget_results_etags(project_id)
+        )
+
+        # Counts only change when the config or a results blob does; both are
+        # revalidated by ETag, so out-of-band writes (workflow runs) are picked up
+        key = (config_etag, results_etags)
+        with self._config_lock:
+            cached = self._counts_cache.get(project_id)
+        if results_etags is not None and cached and cached[0] == key:
+            counts = cached[1]
+        else:
+            counts = self._section_counts(config, await self._get_results(project_id))
+            if results_etags is not None:
+                with self._config_lock:
+                    self._counts_cache[project_id] = (key, counts)
+
+        sections = []
 
+        for section, (question_count, completed_count) in zip(config.get("sections", []), counts):
             completion_percentage = (
                 (completed_count / question_count * 100) if question_count > 0 else 0
             )
 
             sections.append(WorkflowSection(
-                section_id=section_id,
-                section_name=section_name,
+                section_id=section.get("id", ""),
+                section_name=section.get("name", "Unnamed Section"),
                 question_count=question_count,
                 completed_count=completed_count,
                 completion_percentage=round(completion_percentage, 2)
@@ -93,12 +262,8 @@ class WorkflowService:
         task_id = str(uuid.uuid4())
 
         # Get section info
-        config = self._get_workflow_config(project_id)
-        section = None
-        for s in config.get("sections", []):
-            if s.get("id") == section_id:
-                section = s
-                break
+        config = await self._get_workflow_config(project_id)
+        section = self._find_section(config, section_id)
 
         if not section:
             return WorkflowRunResponse(
@@ -112,7 +277,7 @@ class WorkflowService:
         question_count = len(section.get("questions", []))
 
         # Store task info
-        self._tasks[task_id] = {
+        await self._task_store.create(task_id, {
             "task_id": task_id,
             "status": TaskStatus.PENDING,
             "section_id": section_id,
@@ -123,7 +288,7 @@ class WorkflowService:
             "error": None,
             "started_at": datetime.now().isoformat(),
             "completed_at": None
-        }
+        })
 
         # Run workflow in background
         asyncio.create_task(self._execute_workflow(task_id, section_id, project_id))
@@ -137,76 +302,62 @@ class WorkflowService:
         )
 
     async def _execute_workflow(self, task_id: str, section_id: str, project_id: str):
-        """Execute workflow in background"""
-        try:
-            # Update status to running
-            self._tasks[task_id]["status"] = TaskStatus.RUNNING
-
-            # Set environment variable for project
-            os.environ["PRISM_PROJECT_NAME"] = project_id
-
-            print(f"\n[WORKFLOW] ===== STARTING SECTION {section_id} WORKFLOW =====")
-            print(f"[WORKFLOW] Project: {project_id}")
-            print(f"[WORKFLOW] Environment:")
-            print(f"[WORKFLOW]   PRISM_PROJECT_NAME={os.environ.get('PRISM_PROJECT_NAME', 'NOT SET')}")
-            print(f"[WORKFLOW]   AZURE_SEARCH_ENDPOINT={os.environ.get('AZURE_SEARCH_ENDPOINT', 'NOT SET')}")
-            print(f"[WORKFLOW]   AZURE_SEARCH_INDEX_NAME={os.environ.get('AZURE_SEARCH_INDEX_NAME', 'NOT SET')}")
-            print(f"[WORKFLOW] Starting execution...\n")
-
-            # Import and create workflow
-            from workflows.workflow_agent import WorkflowAgentFactory
-
-            factory = WorkflowAgentFactory(project_id)
-            workflow = factory.build_section_workflow(section_id)
-
-            # Start a background task to poll for progress
-            async def update_progress():
-                while self._tasks[task_id]["status"] == TaskStatus.RUNNING:
-                    results = self._get_results(project_id)
-                    section_results = results.get("sections", {}).get(section_id, {})
-                    questions_results = section_results.get("questions", {})
-                    self._tasks[task_id]["questions_completed"] = len(questions_results)
-                    await asyncio.sleep(2)
-
-            progress_task = asyncio.create_task(update_progress())
-
-            # Run the workflow
+        """Execute workflow in background, once a run slot is free"""
+        # Queued runs stay PENDING until they get a slot
+        async with self._run_sem:
             try:
-                result = await workflow.run("Start workflow")
-                print(f"\n[WORKFLOW] ===== SECTION {section_id} COMPLETED SUCCESSFULLY =====\n")
+                # Update status to running
+                await self._task_store.update(task_id, status=TaskStatus.RUNNING)
+
+                # Per-task project for the search tool; concurrent runs for other
+                # projects don't see it (unlike os.environ)
+                PROJECT_NAME.set(project_id)
+
+                # %-style args so nothing is formatted when the level is filtered out
+                logger.info("Starting section %s workflow (project: %s)", section_id, project_id)
+                logger.debug(
+                    "Environment: AZURE_SEARCH_ENDPOINT=%s AZURE_SEARCH_INDEX_NAME=%s",
+                    os.environ.get('AZURE_SEARCH_ENDPOINT', 'NOT SET'),
+                    os.environ.get('AZURE_SEARCH_INDEX_NAME', 'NOT SET')
+                )
+
+                # Import (once per process) and create workflow
+                WorkflowAgentFactory = _get_factory_cls()
+
+                # Progress is pushed by the workflow after each saved answer
+                async def on_question_complete(question_id: str):
+                    await self._task_store.incr(task_id, "questions_completed")
+
+                factory = WorkflowAgentFactory(project_id)
+                workflow = factory.build_section_workflow(section_id, on_question_complete=on_question_complete)
+
+                # Run the workflow
+                try:
+                    result = await workflow.run("Start workflow")
+                    logger.info("Section %s completed successfully", section_id)
+                except Exception:
+                    logger.exception("Section %s failed", section_id)
+                    raise
+
+                # Update task status
+                await self._task_store.update(
+                    task_id,
+                    status=TaskStatus.COMPLETED,
+                    completed_at=datetime.now().isoformat()
+                )
+
             except Exception as e:
-                import traceback
-                print(f"\n[WORKFLOW] ===== SECTION {section_id} FAILED =====")
-                print(f"[WORKFLOW] Error: {e}")
-                print(traceback.format_exc())
-                raise
-
-            # Cancel progress polling
-            progress_task.cancel()
-            try:
-                await progress_task
-            except asyncio.CancelledError:
-                pass
-
-            # Final count
-            results = self._get_results(project_id)
-            section_results = results.get("sections", {}).get(section_id, {})
-            questions_results = section_results.get("questions", {})
-            self._tasks[task_id]["questions_completed"] = len(questions_results)
-
-            # Update task status
-            self._tasks[task_id]["status"] = TaskStatus.COMPLETED
-            self._tasks[task_id]["completed_at"] = datetime.now().isoformat()
-
-        except Exception as e:
-            print(f"Error executing workflow: {e}")
-            self._tasks[task_id]["status"] = TaskStatus.FAILED
-            self._tasks[task_id]["error"] = str(e)
-            self._tasks[task_id]["completed_at"] = datetime.now().isoformat()
-
-    def get_task_status(self, task_id: str) -> Optional[WorkflowStatusResponse]:
+                logger.error("Error executing workflow %s: %s", task_id, e)
+                await self._task_store.update(
+                    task_id,
+                    status=TaskStatus.FAILED,
+                    error=str(e),
+                    completed_at=datetime.now().isoformat()
+                )
+
+    async def get_task_status(self, task_id: str) -> Optional[WorkflowStatusResponse]:
         """Get status of a running workflow task"""
-        task_info = self._tasks.get(task_id)
+        task_info = await self._task_store.get(task_id)
 
         if not task_info:
             return None
@@ -224,206 +375,171 @@ class WorkflowService:
             completed_at=task_info["completed_at"]
         )
 
-    def get_project_results(self, project_id: str) -> Optional[ProjectResults]:
+    async def get_project_results(self, project_id: str) -> Optional[ProjectResults]:
         """Get all results for a project"""
-        results = self._get_results(project_id)
-        config = self._get_workflow_config(project_id)
+        results, config = await asyncio.gather(
+            self._get_results(project_id),
+            self._get_workflow_config(project_id)
+        )
 
         if not results.get("sections"):
             return None
 
-        sections_data = []
-        total_questions = 0
-        answered_questions = 0
+        sections_results = results.get("sections", {})
 
         # Iterate over config sections to preserve order
-        for section in config.get("sections", []):
-            section_id = section.get("id", "")
-            section_name = section.get("name", "Unnamed")
-            questions = section.get("questions", [])
-
-            section_results = results.get("sections", {}).get(section_id, {})
-            questions_results = section_results.get("questions", {})
-
-            section_data = {
-                "section_id": section_id,
-                "section_name": section_name,
-                "questions": []
-            }
-
-            for q in questions:
-                q_id = q.get("id", "")
-                q_text = q.get("question", "")
-                total_questions += 1
-
-                q_result = questions_results.get(q_id, {})
-                answer = q_result.get("answer", "")
-                reference = q_result.get("reference", "")
-                comments = q_result.get("comments", "")
-                evaluation = q_result.get("evaluation", None)
-
-                if answer and answer.strip():
-                    answered_questions += 1
-
-                section_data["questions"].append({
-                    "question_id": q_id,
-                    "question_name": q_text,
-                    "answer": answer if answer else None,
-                    "reference": reference if reference else None,
-                    "comments": comments if comments else None,
-                    "evaluation": evaluation
-                })
-
-            sections_data.append(section_data)
+        sections_data = [
+            _section_result(section, sections_results.get(section.get("id", ""), _EMPTY))
+            for section in config.get("sections", [])
+        ]
+
+        total_questions = sum(len(section["questions"]) for section in sections_data)
+        answered_questions = sum(
+            1
+            for section in sections_data
+            for q in section["questions"]
+            if q["answer"] and q["answer"].strip()
+        )
 
-        return ProjectResults(
+        # Built from our own config/results, so skip re-validating every field
+        return ProjectResults.model_construct(
             project_id=project_id,
             total_questions=total_questions,
             answered_questions=answered_questions,
             sections=sections_data
         )
 
-    def get_section_questions(self, project_id: str, section_id: str) -> List[Dict[str, Any]]:
+    async def get_section_questions(self, project_id: str, section_id: str) -> List[Dict[str, Any]]:
         """Get all questions for a specific section"""
-        config = self._get_workflow_config(project_id)
-
-        for section in config.get("sections", []):
-            if section.get("id") == section_id:
-                return section.get("questions", [])
-
-        return []
+        config = await self._get_workflow_config(project_id)
+        section = self._find_section(config, section_id)
+        if section is None:
+            return []
+        return section.get("questions", [])
 
-    def get_section(self, project_id: str, section_id: str) -> Optional[Dict[str, Any]]:
+    async def get_section(self, project_id: str, section_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific section by ID"""
-        config = self._get_workflow_config(project_id)
+        config = await self._get_workflow_config(project_id)
+        return self._find_section(config, section_id)
 
-        for section in config.get("sections", []):
-            if section.get("id") == section_id:
-                return section
-
-        return None
-
-    def create_section(self, project_id: str, section_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def create_section(self, project_id: str, section_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new section"""
-        config = self._get_workflow_config(project_id)
+        def apply(config: Dict) -> Dict[str, Any]:
+            data = dict(section_data)
 
-        # Generate ID if not provided
-        if "id" not in section_data:
-            section_data["id"] = f"section_{len(config.get('sections', [])) + 1}"
+            # Generate ID if not provided
+            if "id" not in data:
+                data["id"] = f"section_{len(config.get('sections', [])) + 1}"
 
-        # Ensure questions list exists
-        if "questions" not in section_data:
-            section_data["questions"] = []
+            # Ensure questions list exists
+            if "questions" not in data:
+                data["questions"] = []
 
-        config.setdefault("sections", []).append(section_data)
+            config.setdefault("sections", []).append(data)
+            return data
 
-        if self._save_workflow_config(project_id, config):
-            return section_data
-        return None
+        return await self._update_workflow_config(project_id, apply)
 
-    def update_section(self, project_id: str, section_id: str, section_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def update_section(self, project_id: str, section_id: str, section_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update an existing section"""
-        config = self._get_workflow_config(project_id)
-
-        for i, section in enumerate(config.get("sections", [])):
-            if section.get("id") == section_id:
-                # Preserve ID
-                section_data["id"] = section_id
-                # Preserve questions if not provided
-                if "questions" not in section_data:
-                    section_data["questions"] = section.get("questions", [])
-                config["sections"][i] = section_data
-
-                if self._save_workflow_config(project_id, config):
-                    return section_data
+        def apply(config: Dict) -> Optional[Dict[str, Any]]:
+            idx = config["_section_index"].get(section_id)
+            if idx is None:
                 return None
+            section = config["sections"][idx]
+            data = dict(section_data)
 
-        return None
-
-    def delete_section(self, project_id: str, section_id: str) -> bool:
-        """Delete a section"""
-        config = self._get_workflow_config(project_id)
+            # Preserve ID
+            data["id"] = section_id
+            # Preserve questions if not provided
+            if "questions" not in data:
+                data["questions"] = section.get("questions", [])
+            config["sections"][idx] = data
+            return data
 
-        original_len = len(config.get("sections", []))
-        config["sections"] = [s for s in config.get("sections", []) if s.get("id") != section_id]
+        return await self._update_workflow_config(project_id, apply)
 
-        if len(config["sections"]) < original_len:
-            return self._save_workflow_config(project_id, config)
+    async def delete_section(self, project_id: str, section_id: str) -> bool:
+        """Delete a section"""
+        def apply(config: Dict) -> Optional[bool]:
+            idx = config["_section_index"].get(section_id)
+            if idx is None:
+                return None
+            # The config is written and discarded, so the index isn't rebuilt
+            del config["sections"][idx]
+            return True
 
-        return False
+        return await self._update_workflow_config(project_id, apply) is not None
 
-    def add_question(self, project_id: str, section_id: str, question_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def add_question(self, project_id: str, section_id: str, question_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Add a question to a section"""
-        config = self._get_workflow_config(project_id)
-
-        for section in config.get("sections", []):
-            if section.get("id") == section_id:
-                # Generate ID if not provided
-                if "id" not in question_data:
-                    question_data["id"] = f"q{len(section.get('questions', [])) + 1}"
+        def apply(config: Dict) -> Optional[Dict[str, Any]]:
+            section = self._find_section(config, section_id)
+            if section is None:
+                return None
+            data = dict(question_data)
 
-                section.setdefault("questions", []).append(question_data)
+            # Generate ID if not provided
+            if "id" not in data:
+                data["id"] = f"q{len(section.get('questions', [])) + 1}"
 
-                if self._save_workflow_config(project_id, config):
-                    return question_data
-                return None
+            section.setdefault("questions", []).append(data)
+            return data
 
-        return None
+        return await self._update_workflow_config(project_id, apply)
 
-    def update_question(self, project_id: str, section_id: str, question_id: str, question_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def update_question(self, project_id: str, section_id: str, question_id: str, question_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a question"""
-        config = self._get_workflow_config(project_id)
+        def apply(config: Dict) -> Optional[Dict[str, Any]]:
+            location = config["_question_index"].get((section_id, question_id))
+            if location is None:
+                return None
+            section_idx, question_idx = location
+            questions = config["sections"][section_idx]["questions"]
 
-        for section in config.get("sections", []):
-            if section.get("id") == section_id:
-                for i, q in enumerate(section.get("questions", [])):
-                    if q.get("id") == question_id:
-                        # Merge with existing question data to preserve fields not being updated
-                        updated_question = {**q, **question_data}
-                        updated_question["id"] = question_id  # Ensure ID is preserved
-                        section["questions"][i] = updated_question
-
-                        if self._save_workflow_config(project_id, config):
-                            return updated_question
-                        return None
+            # Merge with existing question data to preserve fields not being updated
+            updated_question = {**questions[question_idx], **question_data}
+            updated_question["id"] = question_id  # Ensure ID is preserved
+            questions[question_idx] = updated_question
+            return updated_question
 
-        return None
+        return await self._update_workflow_config(project_id, apply)
 
-    def delete_question(self, project_id: str, section_id: str, question_id: str) -> bool:
+    async def delete_question(self, project_id: str, section_id: str, question_id: str) -> bool:
         """Delete a question from a section"""
-        config = self._get_workflow_config(project_id)
-
-        for section in config.get("sections", []):
-            if section.get("id") == section_id:
-                original_len = len(section.get("questions", []))
-                section["questions"] = [q for q in section.get("questions", []) if q.get("id") != question_id]
-
-                if len(section["questions"]) < original_len:
-                    return self._save_workflow_config(project_id, config)
+        def apply(config: Dict) -> Optional[bool]:
+            location = config["_question_index"].get((section_id, question_id))
+            if location is None:
+                return None
+            section_idx, question_idx = location
+            # The config is written and discarded, so the index isn't rebuilt
+            del config["sections"][section_idx]["questions"][question_idx]
+            return True
 
-        return False
+        return await self._update_workflow_config(project_id, apply) is not None
 
-    def update_section_questions(self, project_id: str, section_id: str, questions: List[Dict[str, Any]]) -> bool:
+    async def update_section_questions(self, project_id: str, section_id: str, questions: List[Dict[str, Any]]) -> bool:
         """Replace all questions in a section with new questions (for CSV import)"""
-        config = self._get_workflow_config(project_id)
-
-        for section in config.get("sections", []):
-            if section.get("id") == section_id:
-                section["questions"] = questions
-                return self._save_workflow_config(project_id, config)
+        def apply(config: Dict) -> Optional[bool]:
+            section = self._find_section(config, section_id)
+            if section is None:
+                return None
+            section["questions"] = questions
+            return True
 
-        return False
+        return await self._update_workflow_config(project_id, apply) is not None
 
-    def clear_section_answers(self, project_id: str, section_id: str) -> int:
+    async def clear_section_answers(self, project_id: str, section_id: str) -> int:
         """Clear all answers for a section"""
-        results = self._get_results(project_id)
+        # Only this section's blob is read and rewritten
+        section_results = await self.storage.aread_section_results(project_id, section_id)
 
-        if section_id not in results.get("sections", {}):
+        if section_results is None:
             return 0
 
-        cleared_count = len(results["sections"][section_id].get("questions", {}))
-        results["sections"][section_id]["questions"] = {}
+        cleared_count = len(section_results.get("questions", {}))
+        section_results["questions"] = {}
 
-        if self._save_results(project_id, results):
+        if await self.storage.awrite_section_results(project_id, section_id, section_results):
             return cleared_count
         return 0
@@ -27,6 +27,7 @@ Structure:
         - upload_to_search: Batch upload to search index
         - create_knowledge_source: Knowledge source wrapper
         - create_knowledge_agent: Knowledge agent creation
+        - teardown_project: Delete a project's agent, source and index
 
     query/                      # Query interface
         - query_knowledge_agent: Interactive query interface
@@ -167,7 +167,7 @@ def evaluate_project_results(project_name: str) -> Dict[str, Any]:
         Dictionary with evaluation results for all questions
     """
     storage = get_storage_service()
-    results = storage.read_json(project_name, "output/results.json")
+    results = storage.read_results(project_name)
 
     if not results:
         logger.error(f"Results file not found for project: {project_name}")
@@ -180,6 +180,7 @@ def evaluate_project_results(project_name: str) -> Dict[str, Any]:
 
     for section_id, section_data in sections.items():
         questions = section_data.get("questions", {})
+        section_evaluated = 0
 
         for question_id, question_data in questions.items():
             answer = question_data.get("answer", "")
@@ -204,14 +205,16 @@ def evaluate_project_results(project_name: str) -> Dict[str, Any]:
             # Store evaluation in question data
             question_data["evaluation"] = eval_result
             total_evaluated += 1
+            section_evaluated += 1
 
             # Collect scores for summary
             for metric, data in eval_result.get("scores", {}).items():
                 if data.get("score") is not None:
                     total_scores[metric].append(data["score"])
 
-    # Save updated results with evaluations to blob storage
-    storage.write_json(project_name, "output/results.json", results)
+        # Save updated section results with evaluations to blob storage
+        if section_evaluated:
+            storage.write_section_results(project_name, section_id, section_data)
 
     # Calculate summary statistics
     summary = {
@@ -248,13 +251,12 @@ def evaluate_question(
         Evaluation result dictionary
     """
     storage = get_storage_service()
-    results = storage.read_json(project_name, "output/results.json")
+    section = storage.read_section_results(project_name, section_id)
 
-    if not results:
+    if not section:
         return {"error": "Results file not found"}
 
     # Find the question
-    section = results.get("sections", {}).get(section_id, {})
     question_data = section.get("questions", {}).get(question_id, {})
 
     if not question_data:
@@ -278,6 +280,6 @@ def evaluate_question(
 
     # Save evaluation to blob storage
     question_data["evaluation"] = eval_result
-    storage.write_json(project_name, "output/results.json", results)
+    storage.write_section_results(project_name, section_id, section)
 
     return eval_result
@@ -3,16 +3,75 @@ Email extraction utility for .msg files (Outlook emails).
 
 This module provides helper functions used by email_extraction_agents.py:
 - format_email_as_markdown(): Convert .msg file to markdown format
+- html_to_text(): Convert an HTML body to plain text (selectolax > lxml > regex)
 
 Note: This is a utility module, not meant to be run standalone.
 """
 
+import re
+import html as html_module
 from pathlib import Path
 import extract_msg
 from scripts.logging_config import get_logger
 
+# Compiled HTML parsers for the HTML-only body fallback; regex scrubbing if neither is installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Regex HTML-to-text fallback patterns, compiled once rather than per email
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Warn when an email's markdown nears the 1MB document limit
+_SIZE_WARN_BYTES = 900 * 1024
+
+
+def html_to_text(html: str) -> str:
+    """
+    Convert an HTML email body to plain text (scripts/styles dropped, entities decoded).
+
+    Args:
+        html: HTML body
+
+    Returns:
+        Text with whitespace collapsed to single spaces
+    """
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(['script', 'style'])
+        root = tree.body or tree.root
+        text = root.text(separator=' ') if root is not None else ''
+    elif LXML_AVAILABLE:
+        try:
+            doc = lxml.html.fromstring(html)
+        except Exception:
+            # lxml rejects empty/whitespace-only documents
+            return ''
+        for node in doc.xpath('//script|//style'):
+            node.drop_tree()
+        # text_content() glues adjacent blocks together; join text nodes like the other backends
+        text = ' '.join(doc.itertext())
+    else:
+        text = _SCRIPT_RE.sub('', html)
+        text = _STYLE_RE.sub('', text)
+        text = _TAG_RE.sub(' ', text)
+        text = html_module.unescape(text)
+
+    return _WS_RE.sub(' ', text).strip()
+
 
 def format_email_as_markdown(msg_path: Path) -> str:
     """
@@ -25,79 +84,75 @@ def format_email_as_markdown(msg_path: Path) -> str:
         Formatted markdown string
     """
     try:
-        # Open the message
-        msg = extract_msg.Message(str(msg_path))
-
-        # Build markdown content
-        markdown = []
-
-        # Header
-        markdown.append(f"# Email: {msg.subject or 'No Subject'}")
-        markdown.append("")
-
-        # Metadata
-        markdown.append("## Email Metadata")
-        markdown.append("")
-        markdown.append(f"**From:** {msg.sender or 'Unknown'}")
-        markdown.append(f"**To:** {msg.to or 'Unknown'}")
-        if msg.cc:
-            markdown.append(f"**CC:** {msg.cc}")
-        if msg.date:
-            markdown.append(f"**Date:** {msg.date}")
-        markdown.append("")
-
-        # Attachments section (list only, attachments not extracted)
-        if msg.attachments:
-            markdown.append("## Attachments")
+        # Open the message; attachment streams are only parsed if touched, and the
+        # file handle is released even if formatting fails
+        with extract_msg.openMsg(str(msg_path), delayAttachments=True) as msg:
+            # Build markdown content
+            markdown = []
+
+            # Header
+            markdown.append(f"# Email: {msg.subject or 'No Subject'}")
+            markdown.append("")
+
+            # Metadata
+            markdown.append("## Email Metadata")
+            markdown.append("")
+            markdown.append(f"**From:** {msg.sender or 'Unknown'}")
+            markdown.append(f"**To:** {msg.to or 'Unknown'}")
+            if msg.cc:
+                markdown.append(f"**CC:** {msg.cc}")
+            if msg.date:
+                markdown.append(f"**Date:** {msg.date}")
             markdown.append("")
-            for i, attachment in enumerate(msg.attachments, 1):
-                att_name = getattr(attachment, 'longFilename', None) or getattr(attachment, 'shortFilename', f'attachment_{i}')
-                att_size = getattr(attachment, 'size', 0)
-                markdown.append(f"{i}. **{att_name}** ({att_size:,} bytes)")
 
+            # Attachments section (list only, attachments not extracted)
+            # Read the attachment list once; name lookups stop at the first hit
+            attachments = msg.attachments
+            if attachments:
+                markdown.append("## Attachments")
+                markdown.append("")
+                for i, attachment in enumerate(attachments, 1):
+                    att_name = (
+                        getattr(attachment, 'longFilename', None)
+                        or getattr(attachment, 'shortFilename', None)
+                        or f'attachment_{i}'
+                    )
+                    att_size = getattr(attachment, 'size', 0) or 0
+                    markdown.append(f"{i}. **{att_name}** ({att_size:,} bytes)")
+
+                markdown.append("")
+
+            # Email body
+            markdown.append("## Email Body")
             markdown.append("")
 
-        # Email body
-        markdown.append("## Email Body")
-        markdown.append("")
-
-        # Try to get plain text body first, fall back to HTML
-        body = msg.body
-
-        if not body and msg.htmlBody:
-            # Simple HTML to text conversion
-            import re
-            html = msg.htmlBody
-            # Remove scripts and styles
-            html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            # Remove HTML tags
-            html = re.sub(r'<[^>]+>', ' ', html)
-            # Decode HTML entities
-            import html as html_module
-            html = html_module.unescape(html)
-            # Clean up whitespace
-            html = re.sub(r'\s+', ' ', html)
-            body = html.strip()
-
-        if body:
-            # Clean up the body
-            body = body.strip()
-            # Add to markdown
-            markdown.append(body)
-        else:
-            markdown.append("*[No body content]*")
-
-        markdown.append("")
-
-        # Close the message
-        msg.close()
+            # Try to get plain text body first, fall back to HTML
+            body = msg.body
+
+            if not body and msg.htmlBody:
+                html = msg.htmlBody
+                if isinstance(html, bytes):
+                    html = html.decode('utf-8', errors='replace')
+                body = html_to_text(html)
+
+            if body:
+                # Clean up the body
+                body = body.strip()
+                # Add to markdown
+                markdown.append(body)
+            else:
+                markdown.append("*[No body content]*")
+
+            markdown.append("")
 
         result = "\n".join(markdown)
 
-        size_kb = len(result.encode('utf-8')) / 1024
-        if size_kb > 900:
-            logger.warning(f"Email {msg_path.name} close to 1MB limit ({size_kb:.1f} KB)")
+        # UTF-8 is 1-4 bytes per char: skip sizing short emails, and ASCII
+        # (str.isascii() is O(1)) needs no encode to measure
+        if len(result) * 4 > _SIZE_WARN_BYTES:
+            size_bytes = len(result) if result.isascii() else len(result.encode('utf-8'))
+            if size_bytes > _SIZE_WARN_BYTES:
+                logger.warning(f"Email {msg_path.name} close to 1MB limit ({size_bytes / 1024:.1f} KB)")
 
         return result
 
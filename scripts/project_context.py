@@ -0,0 +1,33 @@
+"""
+Active project for the current task.
+
+The API can run workflows for several projects at once in one process, so the
+project is carried in a ContextVar (isolated per asyncio task) rather than by
+mutating os.environ. Command-line scripts keep using PRISM_PROJECT_NAME, which
+is the fallback when no project has been set for the current context.
+
+Usage:
+    from scripts.project_context import PROJECT_NAME, get_project_name
+
+    PROJECT_NAME.set("my-project")   # in the task that does the work
+    project = get_project_name()     # anywhere downstream
+"""
+
+import os
+from contextvars import ContextVar
+from typing import Optional
+
+PROJECT_NAME: ContextVar[Optional[str]] = ContextVar("prism_project", default=None)
+
+
+def get_project_name(default: Optional[str] = None) -> Optional[str]:
+    """
+    Get the active project name.
+
+    Args:
+        default: Returned if neither the context nor PRISM_PROJECT_NAME is set
+
+    Returns:
+        Project name from the current context, else PRISM_PROJECT_NAME, else default
+    """
+    return PROJECT_NAME.get() or os.getenv("PRISM_PROJECT_NAME", default)
@@ -29,6 +29,7 @@ from azure.search.documents.agent.models import (
 )
 
 from scripts.logging_config import get_logger
+from scripts.project_context import get_project_name
 
 logger = get_logger(__name__)
 
@@ -59,7 +60,8 @@ def get_index_name() -> str:
     requiring manual configuration. No need to hardcode index names in config.json.
     """
     # Priority 1: Derive from project name (automatic per-project isolation)
-    project_name = os.getenv("PRISM_PROJECT_NAME")
+    # (the API's per-task project wins over the env var)
+    project_name = get_project_name()
     if project_name:
         return f"prism-{project_name}-index"
 
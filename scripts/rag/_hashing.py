@@ -0,0 +1,33 @@
+"""
+Content fingerprints shared by the RAG scripts.
+
+Deduplication and chunking must agree on a document's fingerprint: chunk IDs
+and document_hash are derived from it.
+
+Fingerprints are stored as "blake3:<hex>". Inventories and indexes built before
+the switch hold bare SHA-256 hex digests, so the prefix tells the two apart;
+mixing them means the project needs re-chunking and re-indexing.
+"""
+
+from blake3 import blake3
+
+# Fingerprint width: 128 bits (32 hex chars) is far beyond collision range for dedup
+HASH_DIGEST_BYTES = 16
+
+# Algorithm tag on every stored fingerprint
+HASH_PREFIX = "blake3:"
+
+
+def format_hash(hexdigest: str) -> str:
+    """Tag a BLAKE3 hex digest as a stored fingerprint."""
+    return f"{HASH_PREFIX}{hexdigest}"
+
+
+def hash_digest(content_hash: str) -> str:
+    """Hex digest part of a fingerprint (for IDs, which can't contain ':')."""
+    return content_hash.rpartition(":")[2]
+
+
+def hash_content_bytes(content: bytes) -> str:
+    """Generate 128-bit BLAKE3 fingerprint of raw markdown bytes (no decode/re-encode round trip)."""
+    return format_hash(blake3(content).hexdigest(length=HASH_DIGEST_BYTES))
@@ -25,6 +25,7 @@ from langchain_core.documents import Document
 
 from scripts.logging_config import get_logger
 from apps.api.app.services.storage_service import get_storage_service
+from scripts.rag._hashing import HASH_PREFIX, hash_digest, hash_content_bytes
 
 logger = get_logger(__name__)
 load_dotenv()
@@ -349,7 +350,7 @@ def chunk_document(
         if chunk['token_count'] < 200:
             continue
 
-        chunk_id = f"{content_hash[:8]}_chunk_{chunk_counter:03d}"
+        chunk_id = f"{hash_digest(content_hash)[:8]}_chunk_{chunk_counter:03d}"
         location = chunk['location']
         section_hierarchy = chunk['metadata'] if chunk['metadata'] else {}
 
@@ -435,10 +436,16 @@ def main():
 
             content = content_bytes.decode('utf-8')
 
+            # The inventory's content_hash is null for documents dedup never had to hash,
+            # and untagged in inventories written before BLAKE3 (rehash so IDs match)
+            content_hash = doc.get('content_hash')
+            if not (content_hash or '').startswith(HASH_PREFIX):
+                content_hash = hash_content_bytes(content_bytes)
+
             chunks = chunk_document(
                 doc_path=doc['path'],
                 content=content,
-                content_hash=doc['content_hash'],
+                content_hash=content_hash,
                 target_chunk_size=1000,
                 chunk_overlap=200
             )
@@ -4,38 +4,140 @@ Deduplicate extracted markdown documents.
 Reads extraction results from blob storage, identifies duplicates,
 saves inventory back to blob.
 
+output/document_inventory.json lists the selected documents. Only documents
+that could be duplicates (same size and 4 KiB prefix as another file) are
+hashed, so "content_hash" is null for documents that are unique by
+construction; consumers needing a fingerprint hash the content themselves
+with scripts.rag._hashing.hash_content_bytes.
+
 Usage:
     python main.py deduplicate --project myproject
+    python -m scripts.rag.deduplicate_documents --near-dup   # also drop near-duplicates
 """
 
 import sys
 import os
-import json
-import hashlib
+import argparse
+import io
 from datetime import datetime
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from blake3 import blake3
 from dotenv import load_dotenv
 
 from scripts.logging_config import get_logger
+from scripts.rag._hashing import HASH_DIGEST_BYTES, format_hash, hash_digest, hash_content_bytes
 from apps.api.app.services.storage_service import get_storage_service
 
 logger = get_logger(__name__)
 load_dotenv()
 
+# Parallel blob downloads while loading documents
+DEDUP_CONCURRENCY = int(os.getenv("PRISM_DEDUP_CONCURRENCY", "32"))
+
+# Fingerprints only detect byte-identical files (nothing is signed), so BLAKE3 is
+# used rather than SHA-256: it picks AVX-512/AVX2/SSE4.1/NEON at runtime and
+# update() releases the GIL for large buffers. Feeding it large buffers from the
+# download threads keeps every core hashing.
+HASH_UPDATE_MIN_BYTES = 64 * 1024
+
+# Bytes hashed to split a same-size bucket before paying for full downloads
+PREFIX_HASH_BYTES = 4096
+
+# Near-duplicate detection (--near-dup): MinHash signatures cut into LSH bands. A Bloom
+# filter per band (LSHBloom) is the candidate test; kept signatures and their bands are
+# still held for confirmation, so memory grows with the number of documents
+NEAR_DUP_NUM_PERM = 128
+NEAR_DUP_BANDS = 16  # 16 bands x 8 rows
+NEAR_DUP_MIN_BAND_HITS = 2
+NEAR_DUP_THRESHOLD = float(os.getenv("PRISM_DEDUP_NEAR_DUP_THRESHOLD", "0.8"))
+SHINGLE_WORDS = 5
+
 
 def get_project_name() -> str:
     """Get project name at runtime (not import time)."""
     return os.getenv("PRISM_PROJECT_NAME", "_example")
 
 
-def hash_content(content: str) -> str:
-    """Generate SHA256 hash of markdown content."""
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+def hash_chunks(chunks: Iterable[bytes]) -> Tuple[str, int]:
+    """
+    Hash a stream of byte chunks incrementally.
+
+    Returns:
+        (128-bit BLAKE3 fingerprint, total bytes) - same value as hash_content_bytes on the joined bytes
+    """
+    hasher = blake3()
+    size = 0
+    pending = bytearray()
+    for chunk in chunks:
+        size += len(chunk)
+        if not pending and len(chunk) >= HASH_UPDATE_MIN_BYTES:
+            hasher.update(chunk)
+            continue
+        # Coalesce small chunks so each update() is big enough to run without the GIL
+        pending += chunk
+        if len(pending) >= HASH_UPDATE_MIN_BYTES:
+            hasher.update(pending)
+            pending.clear()
+    if pending:
+        hasher.update(pending)
+    return format_hash(hasher.hexdigest(length=HASH_DIGEST_BYTES)), size
+
+
+def _describe(f: Dict) -> Dict:
+    """Inventory entry for a listed markdown file; content_hash is filled in only if needed."""
+    return {
+        'path': f"output/extraction_results/{f['name']}",
+        'relative_path': f['name'],
+        'content_hash': None,
+        'size_bytes': f['size'],
+        'modified_datetime': f['modified'] or datetime.utcnow().isoformat()
+    }
+
+
+def _hash_prefix(storage, project_name: str, doc: Dict) -> Optional[str]:
+    """Hash the first PREFIX_HASH_BYTES of a document; None if it can't be read."""
+    try:
+        prefix = storage.read_file_range(project_name, doc['path'], 0, PREFIX_HASH_BYTES)
+    except Exception as e:
+        logger.warning(f"Could not read prefix of {doc['relative_path']}: {e}")
+        return None
+    return hash_content_bytes(prefix) if prefix is not None else None
+
+
+def _hash_full(storage, project_name: str, doc: Dict) -> Optional[str]:
+    """Download and hash a whole document; None if it's missing or unreadable."""
+    try:
+        # Hash while downloading so only one chunk per file is held in memory
+        chunks = storage.iter_file_chunks(project_name, doc['path'])
+        if chunks is None:
+            return None
+        content_hash, _ = hash_chunks(chunks)
+        return content_hash
+
+    except Exception as e:
+        logger.warning(f"Could not load {doc['relative_path']}: {e}")
+        return None
+
+
+def _colliding(documents: List[Dict], key: Callable[[Dict], Hashable]) -> List[Dict]:
+    """Documents sharing `key` with at least one other document (the only possible duplicates)."""
+    groups = defaultdict(list)
+    for doc in documents:
+        groups[key(doc)].append(doc)
+    return [doc for group in groups.values() if len(group) > 1 for doc in group]
 
 
 def load_markdown_documents(storage) -> List[Dict]:
-    """Load all markdown documents from blob storage."""
+    """
+    Load all markdown documents from blob storage, hashing only possible duplicates.
+
+    Identical files must share a size, so only same-size files are read: first a
+    PREFIX_HASH_BYTES prefix, then the full content for those whose prefixes also
+    match. Everything else keeps content_hash=None (unique by construction).
+    """
     project_name = get_project_name()
     files = storage.list_files(project_name, "output/extraction_results")
 
@@ -46,74 +148,185 @@ def load_markdown_documents(storage) -> List[Dict]:
     markdown_files = [f for f in files if f["name"].endswith("_markdown.md")]
     logger.info(f"Found {len(markdown_files)} markdown files")
 
-    documents = []
-    for f in markdown_files:
-        try:
-            content_bytes = storage.read_file(project_name, f"output/extraction_results/{f['name']}")
-            if not content_bytes:
-                continue
+    # Empty outputs have nothing to chunk
+    documents = [_describe(f) for f in markdown_files if f['size']]
 
-            content = content_bytes.decode('utf-8')
-            doc = {
-                'path': f"output/extraction_results/{f['name']}",
-                'relative_path': f['name'],
-                'content': content,
-                'content_hash': hash_content(content),
-                'size_bytes': f['size'],
-                'modified_datetime': f['modified'] or datetime.utcnow().isoformat()
-            }
-            documents.append(doc)
+    # Downloads are I/O-bound (the GIL is released on socket reads and while hashing)
+    with ThreadPoolExecutor(max_workers=DEDUP_CONCURRENCY) as executor:
+        same_size = _colliding(documents, itemgetter('size_bytes'))
+        prefix_hashes = dict(zip(
+            (doc['path'] for doc in same_size),
+            executor.map(lambda doc: _hash_prefix(storage, project_name, doc), same_size)
+        ))
 
-        except Exception as e:
-            logger.warning(f"Could not load {f['name']}: {e}")
+        candidates = _colliding(same_size, lambda doc: (doc['size_bytes'], prefix_hashes[doc['path']]))
+        unreadable = set()
+        for doc, content_hash in zip(candidates, executor.map(lambda doc: _hash_full(storage, project_name, doc), candidates)):
+            if content_hash is None:
+                unreadable.add(doc['path'])
+            doc['content_hash'] = content_hash
 
-    return documents
+    logger.info(f"{len(same_size)} share a size, {len(candidates)} fully hashed")
+    return [doc for doc in documents if doc['path'] not in unreadable]
 
 
-def find_duplicates(documents: List[Dict]) -> Tuple[Dict, List]:
-    """Group documents by content hash and select canonical version."""
-    hash_groups = defaultdict(list)
-    for doc in documents:
-        hash_groups[doc['content_hash']].append(doc)
+def group_key(doc: Dict) -> str:
+    """Duplicate-group key: the content hash, or the path for documents never hashed."""
+    return doc['content_hash'] or doc['path']
+
 
+def find_duplicates(documents: List[Dict]) -> Tuple[Dict, List]:
+    """
+    Select the canonical (first seen) version of each document.
+
+    Returns:
+        (duplicate_groups, selected_documents) - duplicate_groups only holds
+        keys seen more than once, so unique documents cost a single dict entry
+    """
+    seen = {}
+    duplicate_groups = {}
     selected_documents = []
-    for content_hash, group in hash_groups.items():
-        if len(group) == 1:
-            selected_documents.append(group[0])
+    for doc in documents:
+        key = group_key(doc)
+        canonical = seen.get(key)
+        if canonical is None:
+            seen[key] = doc
+            selected_documents.append(doc)
+        elif key in duplicate_groups:
+            duplicate_groups[key].append(doc)
         else:
-            # Multiple documents with same hash - select first (arbitrary)
-            selected_documents.append(group[0])
+            duplicate_groups[key] = [canonical, doc]
 
-    return dict(hash_groups), selected_documents
+    return duplicate_groups, selected_documents
 
 
-def generate_report(hash_groups: Dict, selected_documents: List[Dict], total_docs: int) -> str:
-    """Generate deduplication report."""
-    duplicate_groups = {h: g for h, g in hash_groups.items() if len(g) > 1}
-    duplicate_count = sum(len(g) - 1 for g in duplicate_groups.values())
+def _shingles(text: str) -> Set[bytes]:
+    """Word 5-gram shingles of a document (whitespace/case-insensitive)."""
+    words = text.lower().split()
+    if len(words) <= SHINGLE_WORDS:
+        return {" ".join(words).encode('utf-8')}
+    return {
+        " ".join(words[i:i + SHINGLE_WORDS]).encode('utf-8')
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    }
+
+
+def _minhash(storage, project_name: str, doc: Dict) -> Optional[Any]:
+    """MinHash signature of a document's shingles; None if it can't be read."""
+    from datasketch import MinHash
+
+    try:
+        content = storage.read_file(project_name, doc['path'])
+    except Exception as e:
+        logger.warning(f"Could not load {doc['relative_path']}: {e}")
+        return None
+    if not content:
+        return None
+
+    signature = MinHash(num_perm=NEAR_DUP_NUM_PERM)
+    signature.update_batch(list(_shingles(content.decode('utf-8', errors='replace'))))
+    return signature
+
+
+def find_near_duplicates(storage, documents: List[Dict]) -> Dict[str, Dict]:
+    """
+    Find near-duplicates (e.g. re-extractions differing in whitespace or page headers).
+
+    Each MinHash signature is cut into NEAR_DUP_BANDS bands and every band is
+    test-and-inserted into that band's Bloom filter. A document hitting at least
+    NEAR_DUP_MIN_BAND_HITS bands is a candidate, confirmed by estimated Jaccard
+    similarity against the kept documents it shares a band with.
+
+    Args:
+        storage: Storage service
+        documents: Documents in canonical-first order (e.g. exact-dedup output)
+
+    Returns:
+        {near-duplicate path: canonical document}
+    """
+    from pybloom_live import BloomFilter
 
-    lines = [
-        "# Deduplication Report",
-        "",
-        f"**Generated**: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}",
-        f"**Total Documents**: {total_docs}",
-        f"**Unique**: {len(hash_groups)}",
-        f"**Duplicates Removed**: {duplicate_count}",
-        ""
+    project_name = get_project_name()
+    with ThreadPoolExecutor(max_workers=DEDUP_CONCURRENCY) as executor:
+        signatures = list(executor.map(lambda doc: _minhash(storage, project_name, doc), documents))
+
+    rows = NEAR_DUP_NUM_PERM // NEAR_DUP_BANDS
+    band_filters = [
+        BloomFilter(capacity=max(len(documents), 1), error_rate=0.001)
+        for _ in range(NEAR_DUP_BANDS)
     ]
+    # Positions in `kept` by (band, band value), so a candidate is only compared
+    # with documents it shares a band with rather than everything kept so far
+    band_index: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+    kept = []
+    near_duplicates = {}
+
+    for doc, signature in zip(documents, signatures):
+        if signature is None:
+            continue
+
+        values = signature.hashvalues
+        band_keys = [(band, values[band * rows:(band + 1) * rows].tobytes()) for band in range(NEAR_DUP_BANDS)]
+        # add() returns True if the band was (probably) already present
+        hits = sum(band_filters[band].add(key) for band, key in band_keys)
+
+        if hits >= NEAR_DUP_MIN_BAND_HITS:
+            canonical, similarity = None, 0.0
+            # Kept order, so ties still go to the earliest (canonical-first) document
+            for i in sorted({i for band_key in band_keys for i in band_index.get(band_key, ())}):
+                kept_doc, kept_signature = kept[i]
+                estimate = signature.jaccard(kept_signature)
+                if estimate > similarity:
+                    canonical, similarity = kept_doc, estimate
+            if canonical is not None and similarity >= NEAR_DUP_THRESHOLD:
+                near_duplicates[doc['path']] = canonical
+                continue
+
+        for band_key in band_keys:
+            band_index[band_key].append(len(kept))
+        kept.append((doc, signature))
+
+    return near_duplicates
+
+
+def generate_report(
+    duplicate_groups: Dict,
+    selected_documents: List[Dict],
+    total_docs: int,
+    near_duplicates: Optional[Dict[str, Dict]] = None
+) -> Iterator[str]:
+    """Generate deduplication report, yielded line by line."""
+    duplicate_count = sum(len(g) - 1 for g in duplicate_groups.values())
+
+    yield "# Deduplication Report\n\n"
+    yield f"**Generated**: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+    yield f"**Total Documents**: {total_docs}\n"
+    yield f"**Unique**: {len(selected_documents)}\n"
+    yield f"**Duplicates Removed**: {duplicate_count}\n"
+    if near_duplicates is not None:
+        yield f"**Near-Duplicates Removed**: {len(near_duplicates)}\n"
+    yield "\n"
 
     if duplicate_groups:
-        lines.append("## Duplicate Groups")
+        yield "## Duplicate Groups\n"
         for content_hash, group in duplicate_groups.items():
-            lines.append(f"\n### Hash {content_hash[:16]}...")
-            for doc in group:
-                lines.append(f"- {doc['relative_path']}")
+            yield f"\n### Hash {hash_digest(content_hash)[:16]}...\n" + "".join(
+                [f"- {doc['relative_path']}\n" for doc in group]
+            )
 
-    return "\n".join(lines)
+    if near_duplicates:
+        yield "\n## Near-Duplicates\n"
+        for path, canonical in near_duplicates.items():
+            yield f"- {path.rsplit('/', 1)[-1]} ~ {canonical['relative_path']}\n"
 
 
-def main():
-    """Main entry point."""
+def main(near_dup: bool = False):
+    """
+    Main entry point.
+
+    Args:
+        near_dup: Also drop near-duplicates (MinHash + LSHBloom; downloads every unique document)
+    """
     storage = get_storage_service()
 
     documents = load_markdown_documents(storage)
@@ -123,8 +336,15 @@ def main():
 
     logger.info(f"Deduplicating {len(documents)} documents")
 
-    hash_groups, selected_documents = find_duplicates(documents)
-    duplicate_count = sum(len(g) - 1 for g in hash_groups.values() if len(g) > 1)
+    duplicate_groups, selected_documents = find_duplicates(documents)
+    group_size = {key: len(group) for key, group in duplicate_groups.items()}
+    duplicate_count = sum(size - 1 for size in group_size.values())
+
+    near_duplicates = None
+    if near_dup:
+        near_duplicates = find_near_duplicates(storage, selected_documents)
+        selected_documents = [doc for doc in selected_documents if doc['path'] not in near_duplicates]
+        duplicate_count += len(near_duplicates)
 
     # Save inventory to blob
     inventory = {
@@ -132,23 +352,27 @@ def main():
         "total_documents": len(selected_documents),
         "documents": [
             {
+                # null unless the document was hashed as a possible duplicate
                 "content_hash": doc['content_hash'],
                 "path": doc['path'],
                 "relative_path": doc['relative_path'],
                 "size_bytes": doc['size_bytes'],
                 "modified_datetime": doc['modified_datetime'],
-                "has_duplicates": len(hash_groups[doc['content_hash']]) > 1,
-                "duplicate_count": len(hash_groups[doc['content_hash']]) - 1
+                "has_duplicates": size > 1,
+                "duplicate_count": size - 1
             }
             for doc in selected_documents
+            for size in (group_size.get(group_key(doc), 1),)
         ]
     }
     project_name = get_project_name()
     storage.write_json(project_name, "output/document_inventory.json", inventory)
 
     # Save report
-    report = generate_report(hash_groups, selected_documents, len(documents))
-    storage.write_file(project_name, "output/deduplication_report.md", report.encode('utf-8'))
+    report = io.BytesIO()
+    for line in generate_report(duplicate_groups, selected_documents, len(documents), near_duplicates):
+        report.write(line.encode('utf-8'))
+    storage.write_file(project_name, "output/deduplication_report.md", report.getvalue())
 
     logger.info(f"Complete: {len(selected_documents)} unique, {duplicate_count} duplicates removed")
 
@@ -156,4 +380,7 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    parser = argparse.ArgumentParser(description="Deduplicate extracted markdown documents")
+    parser.add_argument("--near-dup", action="store_true", help="Also remove near-duplicate documents")
+    args = parser.parse_args()
+    sys.exit(main(near_dup=args.near_dup))
@@ -0,0 +1,32 @@
+"""
+Shared Azure AI Search index client for the search_index scripts.
+
+The client is cached per (endpoint, key) so that scripts run back to back
+in one process (pipeline, rollback) reuse its HTTP pipeline and connections.
+"""
+
+import os
+import functools
+from typing import Optional
+from scripts.logging_config import get_logger
+
+logger = get_logger(__name__)
+from azure.core.credentials import AzureKeyCredential
+from azure.search.documents.indexes import SearchIndexClient
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_index_client(endpoint: str, admin_key: str) -> SearchIndexClient:
+    return SearchIndexClient(endpoint=endpoint, credential=AzureKeyCredential(admin_key))
+
+
+def get_index_client() -> Optional[SearchIndexClient]:
+    """Initialize Azure AI Search index client."""
+    endpoint = os.getenv("AZURE_SEARCH_ENDPOINT")
+    admin_key = os.getenv("AZURE_SEARCH_ADMIN_KEY")
+
+    if not endpoint or not admin_key:
+        logger.error("Azure AI Search credentials not found in .env")
+        return None
+
+    return _cached_index_client(endpoint, admin_key)
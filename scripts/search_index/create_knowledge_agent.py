@@ -37,8 +37,8 @@ from scripts.logging_config import get_logger
 
 logger = get_logger(__name__)
 from apps.api.app.services.storage_service import get_storage_service
-from azure.core.credentials import AzureKeyCredential
 from azure.search.documents.indexes import SearchIndexClient
+from scripts.search_index._client import get_index_client
 from azure.search.documents.indexes.models import (
     KnowledgeAgent,
     KnowledgeAgentAzureOpenAIModel,
@@ -53,21 +53,6 @@ from azure.search.documents.indexes.models import (
 load_dotenv()
 
 
-def get_index_client() -> SearchIndexClient:
-    """Initialize Azure AI Search index client."""
-    endpoint = os.getenv("AZURE_SEARCH_ENDPOINT")
-    admin_key = os.getenv("AZURE_SEARCH_ADMIN_KEY")
-
-    if not endpoint or not admin_key:
-        logger.error("Azure AI Search credentials not found in .env")
-        return None
-
-    credential = AzureKeyCredential(admin_key)
-    client = SearchIndexClient(endpoint=endpoint, credential=credential)
-
-    return client
-
-
 def verify_knowledge_source_exists(client: SearchIndexClient, source_name: str) -> bool:
     """Verify that the knowledge source exists."""
     try:
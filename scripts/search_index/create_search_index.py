@@ -7,7 +7,7 @@ with semantic ranker for improved relevance.
 Index Schema:
     - chunk_id (key): Unique identifier
     - content (searchable): Markdown content
-    - content_vector (vector): 1024-dimensional embedding
+    - content_vector (vector): 1024-dimensional embedding, int8 scalar-quantized
     - source_file (filterable): Original document filename
     - location (filterable): Document location (Page N, Sheet: Name, etc.)
     - chunk_index (sortable): Position in document
@@ -26,6 +26,8 @@ Configuration:
     - AZURE_SEARCH_ADMIN_KEY
     - AZURE_SEARCH_INDEX_NAME (or derived from PRISM_PROJECT_NAME)
     - PRISM_PROJECT_NAME (optional - used to derive index name)
+    - AZURE_SEARCH_HNSW_M / AZURE_SEARCH_HNSW_EF_CONSTRUCTION / AZURE_SEARCH_HNSW_EF_SEARCH
+      (optional - HNSW tuning, see defaults below)
 """
 
 import sys
@@ -34,8 +36,8 @@ from dotenv import load_dotenv
 from scripts.logging_config import get_logger
 
 logger = get_logger(__name__)
-from azure.core.credentials import AzureKeyCredential
-from azure.search.documents.indexes import SearchIndexClient
+from scripts.search_index._client import get_index_client
+from azure.core.exceptions import ResourceNotFoundError
 from azure.search.documents.indexes.models import (
     SearchIndex,
     SearchField,
@@ -45,6 +47,9 @@ from azure.search.documents.indexes.models import (
     VectorSearch,
     VectorSearchProfile,
     HnswAlgorithmConfiguration,
+    ScalarQuantizationCompression,
+    ScalarQuantizationParameters,
+    RescoringOptions,
     SemanticConfiguration,
     SemanticField,
     SemanticPrioritizedFields,
@@ -59,20 +64,14 @@ from azure.search.documents.indexes.models import (
 # Load environment variables
 load_dotenv()
 
-
-def get_index_client() -> SearchIndexClient:
-    """Initialize Azure AI Search index client."""
-    endpoint = os.getenv("AZURE_SEARCH_ENDPOINT")
-    admin_key = os.getenv("AZURE_SEARCH_ADMIN_KEY")
-
-    if not endpoint or not admin_key:
-        logger.error("Azure AI Search credentials not found in .env")
-        return None
-
-    credential = AzureKeyCredential(admin_key)
-    client = SearchIndexClient(endpoint=endpoint, credential=credential)
-
-    return client
+# HNSW tuning. Larger m builds a denser graph: better recall for more build time and
+# index memory (Azure allows 4-10). efSearch drives query latency (Azure allows 100-1000);
+# with m=8 the 100 floor keeps recall close to efSearch=500 at a fraction of the cost.
+# efConstruction=200 (Azure allows 100-1000) roughly halves graph build time versus 400
+# with little recall loss at m=8.
+HNSW_M = int(os.getenv("AZURE_SEARCH_HNSW_M", "8"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("AZURE_SEARCH_HNSW_EF_CONSTRUCTION", "200"))
+HNSW_EF_SEARCH = int(os.getenv("AZURE_SEARCH_HNSW_EF_SEARCH", "100"))
 
 
 def create_index_definition(index_name: str, vector_dimensions: int = 1024) -> SearchIndex:
@@ -111,6 +110,9 @@ def create_index_definition(index_name: str, vector_dimensions: int = 1024) -> S
             name="content_vector",
             type=SearchFieldDataType.Collection(SearchFieldDataType.Single),
             searchable=True,
+            # Only used for ANN search, never returned - skip the retrievable copy
+            hidden=True,
+            stored=False,
             vector_search_dimensions=vector_dimensions,
             vector_search_profile_name="prism-vector-profile"
         ),
@@ -164,18 +166,31 @@ def create_index_definition(index_name: str, vector_dimensions: int = 1024) -> S
             HnswAlgorithmConfiguration(
                 name="prism-hnsw-config",
                 parameters={
-                    "m": 4,  # Number of bi-directional links (default: 4)
-                    "efConstruction": 400,  # Size of dynamic candidate list (default: 400)
-                    "efSearch": 500,  # Size of candidate list for search (default: 500)
+                    "m": HNSW_M,  # Number of bi-directional links
+                    "efConstruction": HNSW_EF_CONSTRUCTION,  # Size of dynamic candidate list
+                    "efSearch": HNSW_EF_SEARCH,  # Size of candidate list for search
                     "metric": "cosine"  # Distance metric
                 }
             )
         ],
+        compressions=[
+            # HNSW graph holds int8 vectors (4x smaller than float32); the top
+            # candidates are rescored against the original vectors to keep recall
+            ScalarQuantizationCompression(
+                compression_name="prism-sq",
+                parameters=ScalarQuantizationParameters(quantized_data_type="int8"),
+                rescoring_options=RescoringOptions(
+                    enable_rescoring=True,
+                    default_oversampling=4.0
+                )
+            )
+        ],
         profiles=[
             VectorSearchProfile(
                 name="prism-vector-profile",
                 algorithm_configuration_name="prism-hnsw-config",
-                vectorizer_name="prism-aoai-vectorizer"  # Link to vectorizer
+                vectorizer_name="prism-aoai-vectorizer",  # Link to vectorizer
+                compression_name="prism-sq"
             )
         ],
         vectorizers=[vectorizer]  # Add vectorizer configuration
@@ -258,14 +273,15 @@ def main(force: bool = False):
 
     # Check if index already exists
     try:
-        existing_indexes = [idx.name for idx in client.list_indexes()]
-        if index_name in existing_indexes:
-            if force:
-                logger.info(f"Index '{index_name}' exists, deleting...")
-                client.delete_index(index_name)
-            else:
-                logger.info(f"Index '{index_name}' already exists, skipping")
-                return 0
+        client.get_index(index_name)
+        if force:
+            logger.info(f"Index '{index_name}' exists, deleting...")
+            client.delete_index(index_name)
+        else:
+            logger.info(f"Index '{index_name}' already exists, skipping")
+            return 0
+    except ResourceNotFoundError:
+        pass
     except Exception as e:
         logger.warning(f"Could not check existing indexes: {e}")
 
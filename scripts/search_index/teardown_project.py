@@ -0,0 +1,94 @@
+"""
+Tear down all Azure AI Search resources for a project.
+
+Deletes the knowledge agent, knowledge source and search index in one run.
+Existing resources are listed once up front (the three list calls run
+concurrently), so only resources that exist are deleted.
+
+Deletes run agent -> source -> index: each resource is referenced by the
+previous one, and the service rejects deleting a resource that is still
+in use.
+
+Naming Convention:
+    - Agent: prism-{project_name}-index-agent
+    - Source: prism-{project_name}-index-source
+    - Index: prism-{project_name}-index
+
+Usage:
+    python scripts/search_index/teardown_project.py
+
+Configuration:
+    .env variables:
+    - AZURE_SEARCH_ENDPOINT
+    - AZURE_SEARCH_ADMIN_KEY
+    - PRISM_PROJECT_NAME (used to derive resource names)
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Set
+from dotenv import load_dotenv
+from scripts.logging_config import get_logger
+
+logger = get_logger(__name__)
+from azure.core.exceptions import ResourceNotFoundError
+from scripts.search_index._client import get_index_client
+from scripts.search_index.delete_knowledge_agent import get_knowledge_agent_name
+from scripts.search_index.delete_knowledge_source import get_knowledge_source_name
+from scripts.search_index.delete_search_index import get_index_name
+
+
+# Load environment variables
+load_dotenv()
+
+
+def _list_names(list_call: Callable) -> Optional[Set[str]]:
+    """Names returned by a list call; None if the call isn't supported."""
+    try:
+        return {getattr(item, "name", item) for item in list_call()}
+    except Exception as e:
+        logger.warning(f"Could not list resources: {e}")
+        return None
+
+
+def main():
+    """Main entry point."""
+    client = get_index_client()
+    if not client:
+        return 1
+
+    # (label, name, list call, delete call) in dependency order
+    resources = [
+        ("knowledge agent", get_knowledge_agent_name(), client.list_agents, client.delete_agent),
+        ("knowledge source", get_knowledge_source_name(), client.list_knowledge_sources,
+         lambda name: client.delete_knowledge_source(knowledge_source=name)),
+        ("index", get_index_name(), client.list_index_names, client.delete_index),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(resources)) as executor:
+        existing = list(executor.map(lambda r: _list_names(r[2]), resources))
+
+    failed = 0
+    for (label, name, _, delete), names in zip(resources, existing):
+        if names is not None and name not in names:
+            logger.info(f"{label.capitalize()} '{name}' does not exist, nothing to delete")
+            continue
+
+        try:
+            delete(name)
+            logger.info(f"Deleted {label} '{name}'")
+        except ResourceNotFoundError:
+            logger.info(f"{label.capitalize()} '{name}' does not exist, nothing to delete")
+        except Exception as e:
+            logger.error(f"Failed to delete {label} '{name}': {e}")
+            failed += 1
+
+    if failed:
+        return 1
+
+    logger.info("Complete: Project search resources torn down")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
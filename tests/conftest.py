@@ -2,12 +2,30 @@
 Pytest configuration and fixtures for Prism tests.
 """
 import os
-import json
+import sys
+import orjson
 import shutil
 import tempfile
 from pathlib import Path
 import pytest
 
+# tmpfs root for fixture trees (Linux only; --basetemp, TMPDIR or PYTEST_DEBUG_TEMPROOT win)
+SHM_DIR = "/dev/shm"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Keep tmp_path on tmpfs so fixture writes never reach a block device"""
+    if (
+        config.option.basetemp is None
+        and not {"TMPDIR", "PYTEST_DEBUG_TEMPROOT"} & os.environ.keys()
+        and sys.platform.startswith("linux")
+        and os.access(SHM_DIR, os.W_OK)
+    ):
+        # Only the root moves: pytest still makes a numbered pytest-of-<user>/pytest-N
+        # per run, so concurrent runs don't wipe each other's directories
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = SHM_DIR
+
 
 @pytest.fixture
 def temp_projects_dir(tmp_path):
@@ -18,15 +36,12 @@ def temp_projects_dir(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
-def sample_project(temp_projects_dir):
-    """
-    Create a sample project with config and workflow_config files.
-    Returns (base_path, project_name).
-    """
-    project_name = "test_project"
-    projects_dir = temp_projects_dir / "projects"
-    project_path = projects_dir / project_name
+SAMPLE_PROJECT_NAME = "test_project"
+
+
+def _write_sample_project(project_path: Path) -> None:
+    """Write the sample project tree (config, workflow_config, empty dirs)."""
+    project_name = project_path.name
 
     # Create project structure
     project_path.mkdir(parents=True)
@@ -45,8 +60,7 @@ def sample_project(temp_projects_dir):
             "has_agent": False
         }
     }
-    with open(project_path / "config.json", 'w') as f:
-        json.dump(config, f, indent=2)
+    (project_path / "config.json").write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
     # Create workflow_config.json
     workflow_config = {
@@ -82,10 +96,46 @@ def sample_project(temp_projects_dir):
             }
         ]
     }
-    with open(project_path / "workflow_config.json", 'w') as f:
-        json.dump(workflow_config, f, indent=2)
+    (project_path / "workflow_config.json").write_bytes(
+        orjson.dumps(workflow_config, option=orjson.OPT_INDENT_2)
+    )
 
-    return str(temp_projects_dir), project_name
+
+@pytest.fixture(scope="session")
+def _sample_project_template(tmp_path_factory):
+    """
+    Build the sample project tree once per session.
+    Returns the template base path (containing projects/<name>); tests get a
+    copy via sample_project, or share it read-only via readonly_sample_project.
+    """
+    base_path = tmp_path_factory.mktemp("template")
+    _write_sample_project(base_path / "projects" / SAMPLE_PROJECT_NAME)
+    return base_path
+
+
+@pytest.fixture
+def sample_project(temp_projects_dir, _sample_project_template):
+    """
+    Create a sample project with config and workflow_config files.
+    Returns (base_path, project_name).
+    """
+    # Copied (not linked) so tests that write to the project stay isolated
+    shutil.copytree(
+        _sample_project_template / "projects" / SAMPLE_PROJECT_NAME,
+        temp_projects_dir / "projects" / SAMPLE_PROJECT_NAME
+    )
+
+    return str(temp_projects_dir), SAMPLE_PROJECT_NAME
+
+
+@pytest.fixture
+def readonly_sample_project(_sample_project_template):
+    """
+    The shared sample project, without a per-test copy. Only for tests that
+    don't modify the project.
+    Returns (base_path, project_name).
+    """
+    return str(_sample_project_template), SAMPLE_PROJECT_NAME
 
 
 @pytest.fixture
@@ -114,8 +164,7 @@ def sample_project_with_results(sample_project):
         }
     }
     results_path = project_path / "output" / "results.json"
-    with open(results_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    results_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
     return base_path, project_name
 
@@ -145,3 +194,14 @@ def project_with_documents(sample_project):
     (project_path / "subdir" / "sample3.txt").write_text("Nested document content")
 
     return base_path, project_name
+
+
+@pytest.fixture(scope="session")
+def make_tasks():
+    """
+    Create several pipeline tasks in one call.
+    Usage: make_tasks(service, [(project_id, stage), ...]) -> [PipelineTask, ...]
+    """
+    def _make(service, pairs):
+        return [service._create_task(project_id, stage) for project_id, stage in pairs]
+    return _make
@@ -6,11 +6,6 @@ These tests focus on the PipelineService class and its methods.
 import os
 import pytest
 from unittest.mock import patch, MagicMock
-from pathlib import Path
-
-# Add project root to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from apps.api.app.services.pipeline_service import (
     PipelineService,
@@ -20,17 +15,41 @@ from apps.api.app.services.pipeline_service import (
 )
 
 
+@pytest.fixture(scope="module")
+def pipeline_service():
+    """One PipelineService shared by the module's tests"""
+    return PipelineService()
+
+
+@pytest.fixture(autouse=True)
+def _reset_tasks(pipeline_service, monkeypatch):
+    """Give each test fresh, empty task tables on the shared service"""
+    monkeypatch.setattr(pipeline_service, "_tasks", {})
+    monkeypatch.setattr(pipeline_service, "_tasks_by_project", {})
+
+
+@pytest.fixture(scope="module")
+def stages(pipeline_service):
+    """Pipeline stage metadata, built once"""
+    return pipeline_service.get_pipeline_stages()
+
+
+@pytest.fixture(scope="module")
+def stages_by_id(stages):
+    """Pipeline stage metadata indexed by stage id"""
+    return {stage['id']: stage for stage in stages}
+
+
 class TestPipelineStageEnum:
     """Tests for PipelineStage enum"""
 
-    def test_all_stages_exist(self):
-        """All expected pipeline stages should exist"""
-        expected_stages = [
-            'process', 'deduplicate', 'chunk', 'embed',
-            'index_create', 'index_upload', 'source_create', 'agent_create'
-        ]
-        for stage in expected_stages:
-            assert PipelineStage(stage) is not None
+    @pytest.mark.parametrize("value", [
+        'process', 'deduplicate', 'chunk', 'embed',
+        'index_create', 'index_upload', 'source_create', 'agent_create'
+    ])
+    def test_stage_exists(self, value):
+        """Each expected pipeline stage should exist"""
+        assert value in PipelineStage._value2member_map_
 
     def test_stage_values(self):
         """Stage values should match their names"""
@@ -44,11 +63,10 @@ class TestPipelineStageEnum:
 class TestTaskStatus:
     """Tests for TaskStatus enum"""
 
-    def test_all_statuses_exist(self):
-        """All expected task statuses should exist"""
-        expected_statuses = ['pending', 'running', 'completed', 'failed']
-        for status in expected_statuses:
-            assert TaskStatus(status) is not None
+    @pytest.mark.parametrize("value", ['pending', 'running', 'completed', 'failed'])
+    def test_status_exists(self, value):
+        """Each expected task status should exist"""
+        assert value in TaskStatus._value2member_map_
 
     def test_status_values(self):
         """Status values should match their names"""
@@ -68,13 +86,11 @@ class TestPipelineTask:
             project_id="myproject",
             stage=PipelineStage.PROCESS
         )
-        assert task.id == "test-123"
-        assert task.project_id == "myproject"
-        assert task.stage == PipelineStage.PROCESS
-        assert task.status == TaskStatus.PENDING  # Default
-        assert task.started_at is None
-        assert task.completed_at is None
-        assert task.error is None
+        # status defaults to PENDING, timestamps and error to None
+        assert (
+            task.id, task.project_id, task.stage, task.status,
+            task.started_at, task.completed_at, task.error
+        ) == ("test-123", "myproject", PipelineStage.PROCESS, TaskStatus.PENDING, None, None, None)
 
     def test_task_with_status(self):
         """Should create a task with custom status"""
@@ -90,30 +106,19 @@ class TestPipelineTask:
 class TestPipelineService:
     """Tests for PipelineService class"""
 
-    def test_service_initialization(self):
+    def test_service_initialization(self, pipeline_service):
         """Should initialize with correct paths"""
-        service = PipelineService()
-        assert service.projects_dir is not None
-        assert 'projects' in service.projects_dir
+        assert pipeline_service.projects_dir is not None
+        assert 'projects' in pipeline_service.projects_dir
 
-    def test_get_pipeline_stages(self):
+    def test_get_pipeline_stages(self, stages):
         """Should return list of all pipeline stages"""
-        service = PipelineService()
-        stages = service.get_pipeline_stages()
-
         assert len(stages) == 8
-        stage_ids = [s['id'] for s in stages]
-        assert 'process' in stage_ids
-        assert 'chunk' in stage_ids
-        assert 'embed' in stage_ids
-        assert 'index_create' in stage_ids
-        assert 'agent_create' in stage_ids
-
-    def test_get_pipeline_stages_have_descriptions(self):
-        """Each stage should have name and description"""
-        service = PipelineService()
-        stages = service.get_pipeline_stages()
+        stage_ids = {s['id'] for s in stages}
+        assert {'process', 'chunk', 'embed', 'index_create', 'agent_create'} <= stage_ids
 
+    def test_get_pipeline_stages_have_descriptions(self, stages):
+        """Each stage should have name and description"""
         for stage in stages:
             assert 'id' in stage
             assert 'name' in stage
@@ -121,65 +126,68 @@ class TestPipelineService:
             assert len(stage['name']) > 0
             assert len(stage['description']) > 0
 
-    def test_create_task(self):
+    def test_get_pipeline_stages_returns_copies(self, pipeline_service):
+        """Mutating the returned stages should not leak into later calls"""
+        stages = pipeline_service.get_pipeline_stages()
+        stages[0]['name'] = "Changed"
+        stages.clear()
+
+        fresh = pipeline_service.get_pipeline_stages()
+        assert len(fresh) == 8
+        assert fresh[0]['name'] == "Extract Documents"
+
+    def test_create_task(self, pipeline_service):
         """Should create and store a task"""
-        service = PipelineService()
-        task = service._create_task("testproject", PipelineStage.PROCESS)
+        task = pipeline_service._create_task("testproject", PipelineStage.PROCESS)
 
         assert task.id is not None
-        assert task.project_id == "testproject"
-        assert task.stage == PipelineStage.PROCESS
-        assert task.status == TaskStatus.PENDING
+        assert (task.project_id, task.stage, task.status) == ("testproject", PipelineStage.PROCESS, TaskStatus.PENDING)
 
         # Task should be stored
-        retrieved = service.get_task(task.id)
-        assert retrieved is not None
-        assert retrieved.id == task.id
+        retrieved = pipeline_service.get_task(task.id)
+        assert retrieved is not None and retrieved.id == task.id
 
-    def test_get_task_not_found(self):
+    def test_get_task_not_found(self, pipeline_service):
         """Should return None for non-existent task"""
-        service = PipelineService()
-        result = service.get_task("nonexistent-task-id")
+        result = pipeline_service.get_task("nonexistent-task-id")
         assert result is None
 
-    def test_list_tasks_empty(self):
+    def test_list_tasks_empty(self, pipeline_service):
         """Should return empty list when no tasks"""
-        service = PipelineService()
-        tasks = service.list_tasks("newproject")
+        tasks = pipeline_service.list_tasks("newproject")
         assert tasks == []
 
-    def test_list_tasks_filtered_by_project(self):
+    def test_list_tasks_filtered_by_project(self, pipeline_service, make_tasks):
         """Should filter tasks by project"""
-        service = PipelineService()
-
         # Create tasks for different projects
-        task1 = service._create_task("project1", PipelineStage.PROCESS)
-        task2 = service._create_task("project2", PipelineStage.CHUNK)
-        task3 = service._create_task("project1", PipelineStage.EMBED)
+        make_tasks(pipeline_service, [
+            ("project1", PipelineStage.PROCESS),
+            ("project2", PipelineStage.CHUNK),
+            ("project1", PipelineStage.EMBED),
+        ])
 
         # Filter by project1
-        project1_tasks = service.list_tasks("project1")
+        project1_tasks = pipeline_service.list_tasks("project1")
         assert len(project1_tasks) == 2
         assert all(t.project_id == "project1" for t in project1_tasks)
 
         # Filter by project2
-        project2_tasks = service.list_tasks("project2")
+        project2_tasks = pipeline_service.list_tasks("project2")
         assert len(project2_tasks) == 1
         assert project2_tasks[0].project_id == "project2"
 
-    def test_update_task(self):
+    def test_update_task(self, pipeline_service):
         """Should update task fields"""
-        service = PipelineService()
-        task = service._create_task("testproject", PipelineStage.PROCESS)
+        task = pipeline_service._create_task("testproject", PipelineStage.PROCESS)
 
         # Update status
-        service._update_task(task.id, status=TaskStatus.RUNNING)
-        updated = service.get_task(task.id)
+        pipeline_service._update_task(task.id, status=TaskStatus.RUNNING)
+        updated = pipeline_service.get_task(task.id)
         assert updated.status == TaskStatus.RUNNING
 
         # Update with error
-        service._update_task(task.id, status=TaskStatus.FAILED, error="Test error")
-        updated = service.get_task(task.id)
+        pipeline_service._update_task(task.id, status=TaskStatus.FAILED, error="Test error")
+        updated = pipeline_service.get_task(task.id)
         assert updated.status == TaskStatus.FAILED
         assert updated.error == "Test error"
 
@@ -187,37 +195,13 @@ class TestPipelineService:
 class TestPipelineStageDescriptions:
     """Tests for pipeline stage descriptions"""
 
-    def test_process_stage_description(self):
-        """Process stage should have correct description"""
-        service = PipelineService()
-        stages = service.get_pipeline_stages()
-        process_stage = next(s for s in stages if s['id'] == 'process')
-
-        assert 'extract' in process_stage['description'].lower() or 'process' in process_stage['description'].lower()
-
-    def test_chunk_stage_description(self):
-        """Chunk stage should mention RAG or semantic"""
-        service = PipelineService()
-        stages = service.get_pipeline_stages()
-        chunk_stage = next(s for s in stages if s['id'] == 'chunk')
-
-        desc_lower = chunk_stage['description'].lower()
-        assert 'chunk' in desc_lower or 'split' in desc_lower
-
-    def test_embed_stage_description(self):
-        """Embed stage should mention embeddings or vectors"""
-        service = PipelineService()
-        stages = service.get_pipeline_stages()
-        embed_stage = next(s for s in stages if s['id'] == 'embed')
-
-        desc_lower = embed_stage['description'].lower()
-        assert 'embed' in desc_lower or 'vector' in desc_lower
-
-    def test_agent_stage_description(self):
-        """Agent stage should mention agent or retrieval"""
-        service = PipelineService()
-        stages = service.get_pipeline_stages()
-        agent_stage = next(s for s in stages if s['id'] == 'agent_create')
-
-        desc_lower = agent_stage['description'].lower()
-        assert 'agent' in desc_lower or 'retrieval' in desc_lower
+    @pytest.mark.parametrize("stage_id, keywords", [
+        ("process", ["extract", "process"]),
+        ("chunk", ["chunk", "split"]),
+        ("embed", ["embed", "vector"]),
+        ("agent_create", ["agent", "retrieval"]),
+    ])
+    def test_stage_description(self, stages_by_id, stage_id, keywords):
+        """Each stage's description should mention what the stage does"""
+        desc_lower = stages_by_id[stage_id]['description'].lower()
+        assert any(keyword in desc_lower for keyword in keywords)
@@ -1,209 +1,310 @@
 """
 Tests for ProjectService (apps/api/app/services/project_service.py)
 """
-import os
-import json
-from pathlib import Path
+import hashlib
+import orjson
 import pytest
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import BlobPrefix
 
-# Add project root to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from apps.api.app.services import project_service, rollback_service
+from apps.api.app.services.storage_service import StorageService
 from apps.api.app.services.project_service import ProjectService
+from conftest import SAMPLE_PROJECT_NAME
+
+# Not marked slow: tests run on in-memory blobs; only the session template is on disk
+
+
+class MemoryBlobClient:
+    """One blob of a MemoryContainer"""
+
+    def __init__(self, container: "MemoryContainer", name: str):
+        self.container = container
+        self.name = name
+
+    def _content(self) -> bytes:
+        try:
+            return self.container.blobs[self.name]
+        except KeyError:
+            raise ResourceNotFoundError("blob not found") from None
+
+    def exists(self):
+        return self.name in self.container.blobs
+
+    def download_blob(self):
+        content = self._content()
+        return SimpleNamespace(readall=lambda: content, properties=self.container.properties(self.name))
+
+    def upload_blob(self, data, overwrite=False, **kwargs):
+        content = data.read()
+        self.container.check_writable()
+        self.container.blobs[self.name] = content
+        return {"etag": self.container.properties(self.name).etag}
+
+
+class MemoryContainer:
+    """
+    In-memory stand-in for the sync ContainerClient, holding {blob name: content}.
+    Covers only the calls StorageService makes for projects and files.
+    """
+
+    def __init__(self, blobs: dict):
+        self.blobs = blobs
+
+    def check_writable(self):
+        # Storage swallows write errors, so fail the test outright instead
+        if isinstance(self.blobs, MappingProxyType):
+            pytest.fail("write to the shared read-only sample project")
+
+    def properties(self, name: str) -> SimpleNamespace:
+        content = self.blobs[name]
+        return SimpleNamespace(
+            name=name, size=len(content), last_modified=None, etag=hashlib.md5(content).hexdigest()
+        )
+
+    def list_blobs(self, name_starts_with=None, **kwargs):
+        # Snapshot, so callers can delete while iterating (as with the SDK's pager)
+        prefix = name_starts_with or ""
+        return [self.properties(name) for name in sorted(self.blobs) if name.startswith(prefix)]
+
+    def walk_blobs(self, name_starts_with=None, delimiter="/", **kwargs):
+        prefix = name_starts_with or ""
+        seen = set()
+        for blob in self.list_blobs(prefix):
+            head, sep, _ = blob.name[len(prefix):].partition(delimiter)
+            if not sep:
+                yield blob
+            elif head not in seen:
+                seen.add(head)
+                blob_prefix = BlobPrefix()
+                blob_prefix.name = f"{prefix}{head}{delimiter}"
+                yield blob_prefix
+
+    def get_blob_client(self, name: str) -> MemoryBlobClient:
+        return MemoryBlobClient(self, name)
+
+    def delete_blob(self, name: str):
+        if name not in self.blobs:
+            raise ResourceNotFoundError("blob not found")
+        self.check_writable()
+        del self.blobs[name]
+
+
+class MemoryStorage(StorageService):
+    """
+    StorageService over a MemoryContainer. Only the container client is replaced;
+    listing, filtering and JSON handling run through the real StorageService code.
+    """
+
+    def __init__(self, blobs: dict):
+        self._container_client = MemoryContainer(blobs)
+        self._results_cache = {}
+
+
+def _make_service(blobs: dict) -> ProjectService:
+    """ProjectService whose storage is the given {blob name: content} dict"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(project_service, "get_storage_service", lambda: MemoryStorage(blobs))
+        return ProjectService()
+
+
+@pytest.fixture(scope="session")
+def _sample_project_blobs(_sample_project_template):
+    """The sample project template as {blob name: content}, read from disk once"""
+    projects_dir = _sample_project_template / "projects"
+    return {
+        path.relative_to(projects_dir).as_posix(): path.read_bytes()
+        for path in projects_dir.rglob("*") if path.is_file()
+    }
+
+
+@pytest.fixture(scope="class")
+def readonly_service(_sample_project_blobs):
+    """One service per class over the shared sample project blobs (writes fail the test)"""
+    return _make_service(MappingProxyType(_sample_project_blobs))
+
+
+@pytest.fixture
+def blobs(_sample_project_blobs):
+    """This test's own copy of the sample project blobs"""
+    return dict(_sample_project_blobs)
+
+
+@pytest.fixture
+def service(blobs):
+    """Service over this test's copy of the sample project"""
+    return _make_service(blobs)
+
+
+@pytest.fixture
+def empty_service():
+    """Service over an empty container"""
+    return _make_service({})
+
+
+@pytest.fixture
+def rollback(monkeypatch):
+    """Replace RollbackService so deletes don't reach Azure"""
+    mock = MagicMock()
+    monkeypatch.setattr(rollback_service, "RollbackService", mock)
+    return mock.return_value
 
 
 class TestProjectServiceListProjects:
     """Tests for ProjectService.list_projects()"""
 
-    def test_list_projects_empty(self, empty_projects_dir):
+    def test_list_projects_empty(self, empty_service):
         """Should return empty list when no projects exist"""
-        service = ProjectService(base_path=empty_projects_dir)
-        projects = service.list_projects()
+        projects = empty_service.list_projects()
         assert projects == []
 
-    def test_list_projects_with_project(self, sample_project):
+    def test_list_projects_with_project(self, readonly_service):
         """Should return list with project info"""
-        base_path, project_name = sample_project
-        service = ProjectService(base_path=base_path)
-        projects = service.list_projects()
+        projects = readonly_service.list_projects()
 
         assert len(projects) == 1
-        assert projects[0].name == project_name
+        assert projects[0].name == SAMPLE_PROJECT_NAME
 
-    def test_list_projects_ignores_hidden(self, temp_projects_dir):
-        """Should ignore hidden directories (starting with .)"""
-        projects_dir = temp_projects_dir / "projects"
-        projects_dir.mkdir()
+    def test_list_projects_ignores_hidden(self):
+        """Should ignore hidden prefixes (starting with .)"""
+        # Hidden prefix plus a regular project
+        service = _make_service({
+            ".hidden/config.json": b"{}",
+            "regular/config.json": b"{}",
+            "regular/documents/.placeholder": b"",
+        })
 
-        # Create hidden directory
-        hidden_dir = projects_dir / ".hidden"
-        hidden_dir.mkdir()
-
-        # Create regular project
-        regular_dir = projects_dir / "regular"
-        regular_dir.mkdir()
-        (regular_dir / "documents").mkdir()
-        (regular_dir / "output").mkdir()
-
-        service = ProjectService(base_path=str(temp_projects_dir))
         projects = service.list_projects()
 
         assert len(projects) == 1
         assert projects[0].name == "regular"
 
+    def test_list_projects_skips_without_config(self, blobs, service):
+        """Should skip prefixes that have no config.json"""
+        blobs["stray/documents/file.txt"] = b"content"
+
+        projects = service.list_projects()
+
+        assert [p.name for p in projects] == [SAMPLE_PROJECT_NAME]
+
 
 class TestProjectServiceGetProjectInfo:
     """Tests for ProjectService.get_project_info()"""
 
-    def test_get_project_info_exists(self, sample_project):
+    def test_get_project_info_exists(self, readonly_service):
         """Should return project info for existing project"""
-        base_path, project_name = sample_project
-        service = ProjectService(base_path=base_path)
-        info = service.get_project_info(project_name)
+        info = readonly_service.get_project_info(SAMPLE_PROJECT_NAME)
 
         assert info is not None
-        assert info.name == project_name
+        assert info.name == SAMPLE_PROJECT_NAME
         assert info.document_count == 0
         assert info.has_extraction_results is False
 
-    def test_get_project_info_not_exists(self, empty_projects_dir):
+    def test_get_project_info_not_exists(self, empty_service):
         """Should return None for non-existent project"""
-        service = ProjectService(base_path=empty_projects_dir)
-        info = service.get_project_info("nonexistent")
+        info = empty_service.get_project_info("nonexistent")
         assert info is None
 
-    def test_get_project_info_with_documents(self, project_with_documents):
-        """Should count documents correctly"""
-        base_path, project_name = project_with_documents
-        service = ProjectService(base_path=base_path)
-        info = service.get_project_info(project_name)
+    def test_get_project_info_with_documents(self, blobs, service):
+        """Should count documents, skipping placeholders and hidden files"""
+        prefix = f"{SAMPLE_PROJECT_NAME}/documents"
+        blobs.update({
+            f"{prefix}/sample1.txt": b"Sample content 1",
+            f"{prefix}/sample2.txt": b"Sample content 2",
+            f"{prefix}/subdir/sample3.txt": b"Sample content 3",
+            f"{prefix}/.placeholder": b"",
+            f"{prefix}/.DS_Store": b"",
+        })
+
+        info = service.get_project_info(SAMPLE_PROJECT_NAME)
 
         assert info is not None
         assert info.document_count == 3  # 2 in root + 1 in subdir
 
+    def test_get_project_info_with_extraction_results(self, blobs, service):
+        """Should flag extraction results once a real file exists"""
+        prefix = f"{SAMPLE_PROJECT_NAME}/output/extraction_results"
+        blobs[f"{prefix}/.placeholder"] = b""
+        assert service.get_project_info(SAMPLE_PROJECT_NAME).has_extraction_results is False
+
+        blobs[f"{prefix}/sample1_markdown.md"] = b"# Sample"
+        assert service.get_project_info(SAMPLE_PROJECT_NAME).has_extraction_results is True
+
 
 class TestProjectServiceCreateProject:
     """Tests for ProjectService.create_project()"""
 
-    def test_create_project_success(self, temp_projects_dir):
-        """Should create project with correct structure"""
-        projects_dir = temp_projects_dir / "projects"
-        projects_dir.mkdir()
-
-        service = ProjectService(base_path=str(temp_projects_dir))
-        result = service.create_project("new_project")
+    def test_create_project_success(self, empty_service):
+        """Should create the project's config blobs"""
+        result = empty_service.create_project("new_project")
 
         assert result is True
+        assert (
+            empty_service.project_exists("new_project"),
+            empty_service.storage.file_exists("new_project", "workflow_config.json"),
+        ) == (True, True)
 
-        # Check directory structure
-        project_path = projects_dir / "new_project"
-        assert project_path.exists()
-        assert (project_path / "documents").exists()
-        assert (project_path / "output").exists()
-        assert (project_path / "config.json").exists()
-        assert (project_path / "workflow_config.json").exists()
-
-    def test_create_project_config_content(self, temp_projects_dir):
+    def test_create_project_config_content(self):
         """Should create config.json with correct content"""
-        projects_dir = temp_projects_dir / "projects"
-        projects_dir.mkdir()
-
-        service = ProjectService(base_path=str(temp_projects_dir))
+        blobs = {}
+        service = _make_service(blobs)
         service.create_project("new_project")
 
-        config_path = projects_dir / "new_project" / "config.json"
-        with open(config_path) as f:
-            config = json.load(f)
+        config = orjson.loads(blobs["new_project/config.json"])
 
-        assert config["name"] == "new_project"
-        assert "created_at" in config
-        assert config["status"]["has_documents"] is False
-        assert config["status"]["is_processed"] is False
+        assert config.pop("created_at").endswith("Z")
+        assert config == {"name": "new_project", "description": "", "status": {}}
 
-    def test_create_project_workflow_config(self, temp_projects_dir):
+    def test_create_project_workflow_config(self, empty_service):
         """Should create workflow_config.json with empty sections"""
-        projects_dir = temp_projects_dir / "projects"
-        projects_dir.mkdir()
-
-        service = ProjectService(base_path=str(temp_projects_dir))
-        service.create_project("new_project")
-
-        workflow_path = projects_dir / "new_project" / "workflow_config.json"
-        with open(workflow_path) as f:
-            workflow = json.load(f)
+        empty_service.create_project("new_project")
 
-        assert "sections" in workflow
-        assert workflow["sections"] == []
+        workflow = empty_service.storage.read_json("new_project", "workflow_config.json")
 
-    def test_create_project_already_exists(self, sample_project):
-        """Should return False if project already exists"""
-        base_path, project_name = sample_project
-        service = ProjectService(base_path=base_path)
-        result = service.create_project(project_name)
-        assert result is False
+        assert workflow == {"sections": []}
 
 
 class TestProjectServiceDeleteProject:
     """Tests for ProjectService.delete_project()"""
 
-    def test_delete_project_success(self, sample_project):
-        """Should delete project and all contents"""
-        base_path, project_name = sample_project
-        service = ProjectService(base_path=base_path)
+    def test_delete_project_success(self, blobs, service, rollback):
+        """Should delete project and all contents, leaving other projects alone"""
+        blobs["other/config.json"] = b"{}"
+
+        result = service.delete_project(SAMPLE_PROJECT_NAME)
 
-        result = service.delete_project(project_name)
         assert result is True
+        assert list(blobs) == ["other/config.json"]
+        rollback.rollback_stage.assert_called_once_with(SAMPLE_PROJECT_NAME, "extraction", cascade=True)
+
+    def test_delete_project_rollback_error(self, blobs, service, rollback):
+        """Should still delete the blobs if Azure cleanup fails"""
+        rollback.rollback_stage.side_effect = RuntimeError("search service unavailable")
 
-        # Verify deleted
-        project_path = Path(base_path) / "projects" / project_name
-        assert not project_path.exists()
+        result = service.delete_project(SAMPLE_PROJECT_NAME)
 
-    def test_delete_project_not_exists(self, empty_projects_dir):
-        """Should return False if project doesn't exist"""
-        service = ProjectService(base_path=empty_projects_dir)
-        result = service.delete_project("nonexistent")
-        assert result is False
+        assert result is True
+        assert blobs == {}
 
 
 class TestProjectServiceProjectExists:
     """Tests for ProjectService.project_exists()"""
 
-    def test_project_exists_true(self, sample_project):
+    def test_project_exists_true(self, readonly_service):
         """Should return True for existing project"""
-        base_path, project_name = sample_project
-        service = ProjectService(base_path=base_path)
-        assert service.project_exists(project_name) is True
+        assert readonly_service.project_exists(SAMPLE_PROJECT_NAME) is True
 
-    def test_project_exists_false(self, empty_projects_dir):
+    def test_project_exists_false(self, empty_service):
         """Should return False for non-existent project"""
-        service = ProjectService(base_path=empty_projects_dir)
-        assert service.project_exists("nonexistent") is False
-
-
-class TestProjectServicePaths:
-    """Tests for path helper methods"""
-
-    def test_get_documents_path(self, sample_project):
-        """Should return correct documents path"""
-        base_path, project_name = sample_project
-        service = ProjectService(base_path=base_path)
-        path = service.get_documents_path(project_name)
-        # Platform-agnostic check
-        assert "projects" in path and project_name in path and "documents" in path
-
-    def test_get_output_path(self, sample_project):
-        """Should return correct output path"""
-        base_path, project_name = sample_project
-        service = ProjectService(base_path=base_path)
-        path = service.get_output_path(project_name)
-        # Platform-agnostic check
-        assert "projects" in path and project_name in path and "output" in path
-
-    def test_get_results_csv_path(self, sample_project):
-        """Should return correct results.csv path"""
-        base_path, project_name = sample_project
-        service = ProjectService(base_path=base_path)
-        path = service.get_results_csv_path(project_name)
-        # Platform-agnostic check
-        assert "projects" in path and project_name in path and "results.csv" in path
+        assert empty_service.project_exists("nonexistent") is False
+
+
+class TestReadonlySampleProject:
+    """Tests for the shared read-only sample project fixture"""
+
+    def test_readonly_service_rejects_writes(self, readonly_service):
+        """Should fail any test that writes to the shared sample project"""
+        with pytest.raises(pytest.fail.Exception, match="read-only"):
+            readonly_service.create_project("new_project")
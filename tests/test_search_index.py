@@ -4,95 +4,53 @@ Tests for search index scripts (Phase 4: Generalize Search/Query)
 These tests focus on the helper functions and configuration logic.
 Azure API calls are mocked since they require credentials.
 """
-import os
 import pytest
-from unittest.mock import patch, MagicMock
-from pathlib import Path
-
-# Add project root to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-
-class TestGetIndexNameFunction:
-    """Tests for get_index_name() helper function across all scripts"""
-
-    def test_explicit_index_name_takes_priority(self):
-        """Should use AZURE_SEARCH_INDEX_NAME when set"""
-        with patch.dict(os.environ, {"AZURE_SEARCH_INDEX_NAME": "my-custom-index", "PRISM_PROJECT_NAME": "ignored"}):
-            from scripts.search_index.create_search_index import get_index_name
-            assert get_index_name() == "my-custom-index"
-
-    def test_derives_from_project_name(self):
-        """Should derive index name from PRISM_PROJECT_NAME"""
-        # Clear the env var and set project name
-        env = {"PRISM_PROJECT_NAME": "myproject"}
-        with patch.dict(os.environ, env, clear=False):
-            # Remove AZURE_SEARCH_INDEX_NAME if it exists
-            os.environ.pop("AZURE_SEARCH_INDEX_NAME", None)
-            from scripts.search_index.create_search_index import get_index_name
-            result = get_index_name()
-            assert result == "prism-myproject-index"
-
-    def test_default_when_no_config(self):
-        """Should return default when no config is set"""
-        # Remove both env vars
-        os.environ.pop("AZURE_SEARCH_INDEX_NAME", None)
-        os.environ.pop("PRISM_PROJECT_NAME", None)
-        from scripts.search_index.create_search_index import get_index_name
-        result = get_index_name()
-        assert result == "prism-default-index"
-
-
-class TestKnowledgeSourceGetIndexName:
-    """Tests for get_index_name() in create_knowledge_source.py"""
-
-    def test_explicit_index_name(self):
-        """Should use AZURE_SEARCH_INDEX_NAME when set"""
-        with patch.dict(os.environ, {"AZURE_SEARCH_INDEX_NAME": "custom-source-index"}):
-            from scripts.search_index.create_knowledge_source import get_index_name
-            assert get_index_name() == "custom-source-index"
-
-    def test_project_name_derivation(self):
-        """Should derive from PRISM_PROJECT_NAME"""
-        os.environ.pop("AZURE_SEARCH_INDEX_NAME", None)
-        with patch.dict(os.environ, {"PRISM_PROJECT_NAME": "testproj"}):
-            from scripts.search_index.create_knowledge_source import get_index_name
-            assert get_index_name() == "prism-testproj-index"
-
-
-class TestKnowledgeAgentGetIndexName:
-    """Tests for get_index_name() in create_knowledge_agent.py"""
-
-    def test_explicit_index_name(self):
-        """Should use AZURE_SEARCH_INDEX_NAME when set"""
-        with patch.dict(os.environ, {"AZURE_SEARCH_INDEX_NAME": "agent-index"}):
-            from scripts.search_index.create_knowledge_agent import get_index_name
-            assert get_index_name() == "agent-index"
-
-    def test_default_value(self):
-        """Should return default when nothing is set"""
-        os.environ.pop("AZURE_SEARCH_INDEX_NAME", None)
-        os.environ.pop("PRISM_PROJECT_NAME", None)
-        from scripts.search_index.create_knowledge_agent import get_index_name
-        assert get_index_name() == "prism-default-index"
-
-
-class TestQueryAgentGetIndexName:
-    """Tests for get_index_name() in query_knowledge_agent.py"""
-
-    def test_explicit_index_name(self):
-        """Should use AZURE_SEARCH_INDEX_NAME when set"""
-        with patch.dict(os.environ, {"AZURE_SEARCH_INDEX_NAME": "query-index"}):
-            from scripts.query.query_knowledge_agent import get_index_name
-            assert get_index_name() == "query-index"
-
-    def test_project_name_derivation(self):
-        """Should derive from PRISM_PROJECT_NAME"""
-        os.environ.pop("AZURE_SEARCH_INDEX_NAME", None)
-        with patch.dict(os.environ, {"PRISM_PROJECT_NAME": "queryproj"}):
-            from scripts.query.query_knowledge_agent import get_index_name
-            assert get_index_name() == "prism-queryproj-index"
+
+from scripts.search_index.create_search_index import get_index_name as get_index_name_csi
+from scripts.search_index.create_knowledge_source import get_index_name as get_index_name_cks
+from scripts.search_index.create_knowledge_agent import get_index_name as get_index_name_cka
+from scripts.query.query_knowledge_agent import get_index_name as get_index_name_qka
+from scripts.query.query_knowledge_agent import _simplify_query, _expand_query, search_documents
+
+
+@pytest.fixture
+def clean_index_env(monkeypatch):
+    """Unset the index-naming env vars (restored after the test)"""
+    monkeypatch.delenv("AZURE_SEARCH_INDEX_NAME", raising=False)
+    monkeypatch.delenv("PRISM_PROJECT_NAME", raising=False)
+    return monkeypatch
+
+
+@pytest.mark.parametrize("get_index_name, env, expected", [
+    # create_search_index.py
+    # The project-derived name wins over AZURE_SEARCH_INDEX_NAME (documented priority)
+    pytest.param(get_index_name_csi, {"AZURE_SEARCH_INDEX_NAME": "my-custom-index", "PRISM_PROJECT_NAME": "myproject"},
+                 "prism-myproject-index", id="create_index-project_takes_priority"),
+    pytest.param(get_index_name_csi, {"AZURE_SEARCH_INDEX_NAME": "my-custom-index"},
+                 "my-custom-index", id="create_index-explicit_without_project"),
+    pytest.param(get_index_name_csi, {"PRISM_PROJECT_NAME": "myproject"},
+                 "prism-myproject-index", id="create_index-derives_from_project"),
+    pytest.param(get_index_name_csi, {}, "prism-default-index", id="create_index-default"),
+    # create_knowledge_source.py
+    pytest.param(get_index_name_cks, {"AZURE_SEARCH_INDEX_NAME": "custom-source-index"},
+                 "custom-source-index", id="knowledge_source-explicit"),
+    pytest.param(get_index_name_cks, {"PRISM_PROJECT_NAME": "testproj"},
+                 "prism-testproj-index", id="knowledge_source-derives_from_project"),
+    # create_knowledge_agent.py
+    pytest.param(get_index_name_cka, {"AZURE_SEARCH_INDEX_NAME": "agent-index"},
+                 "agent-index", id="knowledge_agent-explicit"),
+    pytest.param(get_index_name_cka, {}, "prism-default-index", id="knowledge_agent-default"),
+    # query_knowledge_agent.py
+    pytest.param(get_index_name_qka, {"AZURE_SEARCH_INDEX_NAME": "query-index"},
+                 "query-index", id="query_agent-explicit"),
+    pytest.param(get_index_name_qka, {"PRISM_PROJECT_NAME": "queryproj"},
+                 "prism-queryproj-index", id="query_agent-derives_from_project"),
+])
+def test_get_index_name(get_index_name, env, expected, clean_index_env):
+    """get_index_name() in each script resolves the same env-driven name"""
+    for key, value in env.items():
+        clean_index_env.setenv(key, value)
+    assert get_index_name() == expected
 
 
 class TestNamingConventions:
@@ -126,51 +84,25 @@ class TestNamingConventions:
 class TestQueryHelperFunctions:
     """Tests for query helper functions"""
 
-    def test_simplify_query_scada(self):
-        """Should simplify SCADA queries"""
-        from scripts.query.query_knowledge_agent import _simplify_query
-
-        result = _simplify_query("OSS Wind Farm SCADA")
-        assert result == "SCADA system"
-
-    def test_simplify_query_substation(self):
-        """Should simplify substation queries"""
-        from scripts.query.query_knowledge_agent import _simplify_query
-
-        result = _simplify_query("132kV substation automation requirements")
-        assert result == "substation"
-
-    def test_simplify_query_no_match(self):
-        """Should return original if no simplification matches"""
-        from scripts.query.query_knowledge_agent import _simplify_query
-
-        result = _simplify_query("random query with no keywords")
-        assert result == "random query with no keywords"
-
-    def test_expand_query_scada(self):
-        """Should expand SCADA queries with synonyms"""
-        from scripts.query.query_knowledge_agent import _expand_query
-
-        result = _expand_query("SCADA requirements")
-        assert "SCADA requirements" in result
-        assert "OR" in result
-        assert "substation control system" in result
-
-    def test_expand_query_automation(self):
-        """Should expand automation queries"""
-        from scripts.query.query_knowledge_agent import _expand_query
-
-        result = _expand_query("automation system specs")
-        assert "automation system specs" in result
-        assert "OR" in result
-
-    def test_expand_query_fallback(self):
-        """Should add generic broadening for unmatched queries"""
-        from scripts.query.query_knowledge_agent import _expand_query
-
-        result = _expand_query("general query")
-        assert "general query" in result
-        assert "OR control OR monitoring OR system" in result
+    @pytest.mark.parametrize("query, expected", [
+        pytest.param("OSS Wind Farm SCADA", "SCADA system", id="scada"),
+        pytest.param("132kV substation automation requirements", "substation", id="substation"),
+        pytest.param("random query with no keywords", "random query with no keywords", id="no_match"),
+    ])
+    def test_simplify_query(self, query, expected):
+        """Should simplify known topics and return other queries unchanged"""
+        assert _simplify_query(query) == expected
+
+    @pytest.mark.parametrize("query, must_contain", [
+        pytest.param("SCADA requirements", ["SCADA requirements", "OR", "substation control system"], id="scada"),
+        pytest.param("automation system specs", ["automation system specs", "OR"], id="automation"),
+        pytest.param("general query", ["general query", "OR control OR monitoring OR system"], id="fallback"),
+    ])
+    def test_expand_query(self, query, must_contain):
+        """Should expand known topics with synonyms and broaden everything else"""
+        result = _expand_query(query)
+        for expected in must_contain:
+            assert expected in result
 
 
 class TestSearchDocumentsFunction:
@@ -178,13 +110,10 @@ class TestSearchDocumentsFunction:
 
     def test_function_exists(self):
         """Verify search_documents function exists"""
-        from scripts.query.query_knowledge_agent import search_documents
         assert callable(search_documents)
 
     def test_function_docstring_is_generic(self):
         """Docstring should not contain RFP-specific references"""
-        from scripts.query.query_knowledge_agent import search_documents
-
         docstring = search_documents.__doc__
         assert "RFP" not in docstring
         assert "indexed documents" in docstring.lower() or "documents" in docstring.lower()
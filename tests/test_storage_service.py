@@ -0,0 +1,161 @@
+"""
+Tests for StorageService (apps/api/app/services/storage_service.py)
+"""
+import orjson
+import pytest
+from types import SimpleNamespace
+from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
+
+from apps.api.app.services.storage_service import StorageService, RESULTS_DIR, LEGACY_RESULTS_PATH
+
+PROJECT = "test_project"
+
+
+class AsyncMemoryContainer:
+    """
+    In-memory stand-in for the asyncio ContainerClient, holding {blob name: content}.
+
+    Like the real service, listings report bare ETags while downloads report the
+    quoted ETag header, so callers that compare the two never match.
+    """
+
+    def __init__(self):
+        self.blobs = {}
+        self.versions = {}
+        self.downloads = []
+        self.list_error = None
+        self.read_error = None
+
+    def put(self, relative_path: str, data: dict):
+        name = f"{PROJECT}/{relative_path}"
+        self.blobs[name] = orjson.dumps(data)
+        self.versions[name] = self.versions.get(name, 0) + 1
+
+    def etag(self, name: str) -> str:
+        return f"0x8D{self.versions[name]:012X}"
+
+    async def list_blobs(self, name_starts_with=None, **kwargs):
+        if self.list_error:
+            raise self.list_error
+        for name in sorted(self.blobs):
+            if name.startswith(name_starts_with or ""):
+                yield SimpleNamespace(name=name, etag=self.etag(name))
+
+    def get_blob_client(self, name: str):
+        container = self
+
+        class BlobClient:
+            async def get_blob_properties(self):
+                if container.read_error:
+                    raise container.read_error
+                if name not in container.blobs:
+                    raise ResourceNotFoundError("blob not found")
+                return SimpleNamespace(etag=f'"{container.etag(name)}"')
+
+            async def download_blob(self):
+                if container.read_error:
+                    raise container.read_error
+                if name not in container.blobs:
+                    raise ResourceNotFoundError("blob not found")
+                container.downloads.append(name[len(PROJECT) + 1:])
+                content = container.blobs[name]
+
+                class Downloader:
+                    properties = SimpleNamespace(etag=f'"{container.etag(name)}"')
+
+                    async def readall(self):
+                        return content
+
+                return Downloader()
+
+        return BlobClient()
+
+
+class AsyncMemoryStorage(StorageService):
+    """StorageService whose asyncio container client is an AsyncMemoryContainer"""
+
+    def __init__(self):
+        self.container = AsyncMemoryContainer()
+        self._results_cache = {}
+
+    def _get_async_container_client(self):
+        return self.container
+
+
+@pytest.fixture
+def storage():
+    """Storage with legacy results plus one section blob"""
+    storage = AsyncMemoryStorage()
+    storage.container.put(LEGACY_RESULTS_PATH, {"sections": {
+        "section1": {"questions": {"q1": {"answer": "legacy"}}},
+        "section2": {"questions": {"q1": {"answer": "legacy"}}},
+    }})
+    storage.container.put(f"{RESULTS_DIR}/section1.json", {"questions": {"q1": {"answer": "new"}}})
+    return storage
+
+
+class TestStorageServiceReadResults:
+    """Tests for StorageService.aread_results()"""
+
+    async def test_section_blobs_override_legacy(self, storage):
+        """Should overlay section blobs on the legacy results"""
+        results = await storage.aread_results(PROJECT)
+
+        assert results["sections"]["section1"]["questions"]["q1"]["answer"] == "new"
+        assert results["sections"]["section2"]["questions"]["q1"]["answer"] == "legacy"
+
+    async def test_unchanged_blobs_served_from_cache(self, storage):
+        """Should not re-download blobs whose listing ETag is unchanged"""
+        first = await storage.aread_results(PROJECT)
+        storage.container.downloads.clear()
+
+        second = await storage.aread_results(PROJECT)
+
+        assert storage.container.downloads == []
+        assert second == first
+
+    async def test_changed_blob_refetched(self, storage):
+        """Should download only the blob that changed since the last read"""
+        await storage.aread_results(PROJECT)
+        storage.container.downloads.clear()
+        storage.container.put(f"{RESULTS_DIR}/section1.json", {"questions": {"q1": {"answer": "newer"}}})
+
+        results = await storage.aread_results(PROJECT)
+
+        assert storage.container.downloads == [f"{RESULTS_DIR}/section1.json"]
+        assert results["sections"]["section1"]["questions"]["q1"]["answer"] == "newer"
+
+    async def test_callers_get_independent_copies(self, storage):
+        """Should not let one caller's edits leak into the cache"""
+        results = await storage.aread_results(PROJECT)
+        results["sections"]["section1"]["questions"].clear()
+
+        results = await storage.aread_results(PROJECT)
+
+        assert results["sections"]["section1"]["questions"]["q1"]["answer"] == "new"
+
+    async def test_listing_failure_falls_back_to_full_read(self, storage, monkeypatch):
+        """Should fall back to read_results instead of dropping section blobs"""
+        storage.container.list_error = HttpResponseError("service unavailable")
+        full = {"sections": {"section1": {"questions": {}}}}
+        monkeypatch.setattr(storage, "read_results", lambda project_name: full)
+
+        assert await storage.aread_results(PROJECT) is full
+
+
+class TestStorageServiceEtags:
+    """Tests for StorageService.aget_etag() / aread_json_with_etag()"""
+
+    async def test_missing_blob_reads_as_none(self, storage):
+        """Should return None only when the blob does not exist"""
+        assert await storage.aget_etag(PROJECT, "workflow_config.json") is None
+        assert await storage.aread_json_with_etag(PROJECT, "workflow_config.json") == (None, None)
+
+    async def test_storage_errors_propagate(self, storage):
+        """Should raise other errors, so callers never treat them as a missing blob"""
+        storage.container.read_error = HttpResponseError("service unavailable")
+
+        with pytest.raises(HttpResponseError):
+            await storage.aget_etag(PROJECT, LEGACY_RESULTS_PATH)
+        with pytest.raises(HttpResponseError):
+            await storage.aread_json_with_etag(PROJECT, LEGACY_RESULTS_PATH)
@@ -5,56 +5,58 @@ Note: These tests focus on config loading and helper functions.
 Agent creation tests are skipped as they require Azure OpenAI credentials.
 """
 import os
-import json
+import orjson
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 import pytest
 
-# Add project root to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from workflows import workflow_agent as wa_mod
+
+# Fixtures build real project trees under tmp_path
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(autouse=True)
+def _mock_azure(monkeypatch):
+    """Mock the Azure OpenAI client since we don't have credentials"""
+    monkeypatch.setattr(wa_mod, "AzureOpenAIChatClient", MagicMock())
+
+
+@pytest.fixture
+def factory(_mock_azure, readonly_sample_project):
+    """Factory for the shared sample project, built after the Azure client is mocked"""
+    _, project_name = readonly_sample_project
+    return wa_mod.WorkflowAgentFactory(project_name)
 
 
 class TestLoadWorkflowConfig:
     """Tests for load_workflow_config()"""
 
-    def test_load_config_success(self, sample_project, monkeypatch):
+    def test_load_config_success(self, readonly_sample_project):
         """Should load workflow config from project folder"""
-        base_path, project_name = sample_project
+        base_path, project_name = readonly_sample_project
 
-        # Change to temp directory so relative paths work
-        monkeypatch.chdir(base_path)
-
-        from workflows.workflow_agent import load_workflow_config
-        config = load_workflow_config(project_name)
+        config = wa_mod.load_workflow_config(project_name)
 
         assert config is not None
         assert "sections" in config
         assert len(config["sections"]) == 2
         assert config["sections"][0]["id"] == "section1"
 
-    def test_load_config_not_found(self, temp_projects_dir, monkeypatch):
+    def test_load_config_not_found(self, temp_projects_dir):
         """Should raise FileNotFoundError if config doesn't exist"""
-        monkeypatch.chdir(temp_projects_dir)
-
-        from workflows.workflow_agent import load_workflow_config
-
         with pytest.raises(FileNotFoundError):
-            load_workflow_config("nonexistent")
+            wa_mod.load_workflow_config("nonexistent")
 
 
 class TestListProjectSections:
     """Tests for list_project_sections()"""
 
-    def test_list_sections_success(self, sample_project, monkeypatch):
+    def test_list_sections_success(self, readonly_sample_project):
         """Should return list of section info dicts"""
-        base_path, project_name = sample_project
-        monkeypatch.chdir(base_path)
+        base_path, project_name = readonly_sample_project
 
-        # Mock the Azure OpenAI client since we don't have credentials
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import list_project_sections
-            sections = list_project_sections(project_name)
+        sections = wa_mod.list_project_sections(project_name)
 
         assert len(sections) == 2
         assert sections[0]["id"] == "section1"
@@ -65,70 +67,42 @@ class TestListProjectSections:
 class TestWorkflowAgentFactory:
     """Tests for WorkflowAgentFactory class"""
 
-    def test_factory_init_loads_config(self, sample_project, monkeypatch):
+    def test_factory_init_loads_config(self, readonly_sample_project):
         """Should load config on initialization"""
-        base_path, project_name = sample_project
-        monkeypatch.chdir(base_path)
+        base_path, project_name = readonly_sample_project
 
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import WorkflowAgentFactory
-            factory = WorkflowAgentFactory(project_name)
+        factory = wa_mod.WorkflowAgentFactory(project_name)
 
         assert factory.project_name == project_name
         assert factory.config is not None
         assert len(factory.config["sections"]) == 2
 
-    def test_factory_get_all_section_ids(self, sample_project, monkeypatch):
+    def test_factory_get_all_section_ids(self, factory):
         """Should return all section IDs"""
-        base_path, project_name = sample_project
-        monkeypatch.chdir(base_path)
-
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import WorkflowAgentFactory
-            factory = WorkflowAgentFactory(project_name)
-            section_ids = factory.get_all_section_ids()
+        section_ids = factory.get_all_section_ids()
 
         assert section_ids == ["section1", "section2"]
 
-    def test_factory_get_section_info_exists(self, sample_project, monkeypatch):
+    def test_factory_get_section_info_exists(self, factory):
         """Should return info for existing section"""
-        base_path, project_name = sample_project
-        monkeypatch.chdir(base_path)
-
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import WorkflowAgentFactory
-            factory = WorkflowAgentFactory(project_name)
-            info = factory.get_section_info("section1")
+        info = factory.get_section_info("section1")
 
         assert info is not None
         assert info["id"] == "section1"
         assert info["name"] == "Test Section 1"
         assert info["question_count"] == 2
 
-    def test_factory_get_section_info_not_exists(self, sample_project, monkeypatch):
+    def test_factory_get_section_info_not_exists(self, factory):
         """Should return None for non-existent section"""
-        base_path, project_name = sample_project
-        monkeypatch.chdir(base_path)
-
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import WorkflowAgentFactory
-            factory = WorkflowAgentFactory(project_name)
-            info = factory.get_section_info("nonexistent")
+        info = factory.get_section_info("nonexistent")
 
         assert info is None
 
-    def test_factory_build_agent_instructions(self, sample_project, monkeypatch):
+    def test_factory_build_agent_instructions(self, factory):
         """Should build correct agent instructions from template and question"""
-        base_path, project_name = sample_project
-        monkeypatch.chdir(base_path)
-
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import WorkflowAgentFactory
-            factory = WorkflowAgentFactory(project_name)
-
-            section = factory.config["sections"][0]
-            question = section["questions"][0]
-            instructions = factory._build_agent_instructions(section, question)
+        section = factory.config["sections"][0]
+        question = section["questions"][0]
+        instructions = factory._build_agent_instructions(section, question)
 
         # Check that template, question, and instructions are included
         assert "Answer the following question based on the documents" in instructions
@@ -137,23 +111,25 @@ class TestWorkflowAgentFactory:
         assert "Response Format" in instructions
 
 
+@pytest.fixture
+def fresh_project(temp_projects_dir):
+    """Minimal project with a workflow config and no output directory"""
+    project_path = temp_projects_dir / "projects" / "fresh_project"
+    project_path.mkdir(parents=True)
+    (project_path / "workflow_config.json").write_bytes(orjson.dumps({"sections": []}))
+    return str(temp_projects_dir), "fresh_project"
+
+
 class TestWorkflowAgentFactoryOutputDir:
     """Tests for output directory creation"""
 
-    def test_factory_creates_output_dir(self, sample_project, monkeypatch):
+    def test_factory_creates_output_dir(self, fresh_project):
         """Should create output directory on initialization"""
-        base_path, project_name = sample_project
-        monkeypatch.chdir(base_path)
-
-        # Remove output dir first
+        base_path, project_name = fresh_project
         output_dir = Path(base_path) / "projects" / project_name / "output"
-        if output_dir.exists():
-            import shutil
-            shutil.rmtree(output_dir)
+        assert not output_dir.exists()
 
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import WorkflowAgentFactory
-            factory = WorkflowAgentFactory(project_name)
+        factory = wa_mod.WorkflowAgentFactory(project_name)
 
         assert factory.output_dir.exists()
 
@@ -161,7 +137,7 @@ class TestWorkflowAgentFactoryOutputDir:
 class TestWorkflowConfigValidation:
     """Tests for handling invalid workflow configs"""
 
-    def test_empty_sections(self, temp_projects_dir, monkeypatch):
+    def test_empty_sections(self, temp_projects_dir):
         """Should handle empty sections list"""
         projects_dir = temp_projects_dir / "projects"
         projects_dir.mkdir()
@@ -170,18 +146,13 @@ class TestWorkflowConfigValidation:
         (project_path / "output").mkdir()
 
         # Create config with empty sections
-        with open(project_path / "workflow_config.json", 'w') as f:
-            json.dump({"sections": []}, f)
+        (project_path / "workflow_config.json").write_bytes(orjson.dumps({"sections": []}))
 
-        monkeypatch.chdir(temp_projects_dir)
-
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import WorkflowAgentFactory
-            factory = WorkflowAgentFactory("empty_sections")
+        factory = wa_mod.WorkflowAgentFactory("empty_sections")
 
         assert factory.get_all_section_ids() == []
 
-    def test_section_without_questions(self, temp_projects_dir, monkeypatch):
+    def test_section_without_questions(self, temp_projects_dir):
         """Should handle section with no questions"""
         projects_dir = temp_projects_dir / "projects"
         projects_dir.mkdir()
@@ -199,14 +170,9 @@ class TestWorkflowConfigValidation:
                 }
             ]
         }
-        with open(project_path / "workflow_config.json", 'w') as f:
-            json.dump(config, f)
-
-        monkeypatch.chdir(temp_projects_dir)
+        (project_path / "workflow_config.json").write_bytes(orjson.dumps(config))
 
-        with patch('workflows.workflow_agent.AzureOpenAIChatClient'):
-            from workflows.workflow_agent import WorkflowAgentFactory
-            factory = WorkflowAgentFactory("no_questions")
-            info = factory.get_section_info("empty_section")
+        factory = wa_mod.WorkflowAgentFactory("no_questions")
+        info = factory.get_section_info("empty_section")
 
         assert info["question_count"] == 0
@@ -2,25 +2,107 @@
 Tests for WorkflowService (apps/api/app/services/workflow_service.py)
 """
 import os
-import json
-from pathlib import Path
+import hashlib
+import orjson
 import pytest
+from pathlib import Path
+from azure.core.exceptions import ResourceModifiedError, ResourceExistsError
 
-# Add project root to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from apps.api.app.services import workflow_service
+from apps.api.app.services.storage_service import StorageService, RESULTS_DIR, LEGACY_RESULTS_PATH
 from apps.api.app.services.workflow_service import WorkflowService
 
+# Fixtures build real project trees under tmp_path
+pytestmark = pytest.mark.slow
+
+
+class LocalStorage(StorageService):
+    """
+    StorageService over a local projects tree ({base_path}/projects/{name}/...).
+
+    Only the blob primitives are replaced; results merging, caching and JSON
+    handling run through the real StorageService code. ETags are content hashes.
+    """
+
+    def __init__(self, base_path: str):
+        self.projects_dir = Path(base_path) / "projects"
+        self._results_cache = {}
+
+    def _path(self, project_name: str, relative_path: str) -> Path:
+        return self.projects_dir / project_name / relative_path
+
+    @staticmethod
+    def _etag(content: bytes) -> str:
+        return hashlib.md5(content).hexdigest()
+
+    async def aread_file(self, project_name, relative_path):
+        try:
+            return self._path(project_name, relative_path).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    async def awrite_file(self, project_name, relative_path, content):
+        path = self._path(project_name, relative_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        return True
+
+    async def aget_etag(self, project_name, relative_path):
+        content = await self.aread_file(project_name, relative_path)
+        return None if content is None else self._etag(content)
+
+    async def aread_json_with_etag(self, project_name, relative_path):
+        content = await self.aread_file(project_name, relative_path)
+        if content is None:
+            return None, None
+        return self._parse_json(content, relative_path), self._etag(content)
+
+    async def awrite_json_if_match(self, project_name, relative_path, data, etag, indent=True):
+        current = await self.aget_etag(project_name, relative_path)
+        if etag is None and current is not None:
+            raise ResourceExistsError("blob already exists")
+        if etag is not None and current != etag:
+            raise ResourceModifiedError("blob changed since it was read")
+        content = self._dump_json(data, indent)
+        await self.awrite_file(project_name, relative_path, content)
+        return self._etag(content)
+
+    async def aget_results_etags(self, project_name):
+        project_dir = self.projects_dir / project_name
+        paths = [project_dir / LEGACY_RESULTS_PATH, *(project_dir / RESULTS_DIR).rglob("*.json")]
+        return tuple(sorted(
+            (path.relative_to(project_dir).as_posix(), self._etag(path.read_bytes()))
+            for path in paths if path.is_file()
+        ))
+
+
+def _make_service(base_path: str) -> WorkflowService:
+    """WorkflowService whose storage reads and writes under base_path"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(workflow_service, "get_storage_service", lambda: LocalStorage(base_path))
+        return WorkflowService()
+
+
+@pytest.fixture(scope="class")
+def readonly_service(_sample_project_template):
+    """One service per class over the shared sample project (never mutated)"""
+    return _make_service(str(_sample_project_template))
+
+
+@pytest.fixture
+def service(sample_project):
+    """Service bound to this test's own copy of the sample project"""
+    base_path, _ = sample_project
+    return _make_service(base_path)
+
 
 class TestWorkflowServiceListSections:
     """Tests for WorkflowService.list_sections()"""
 
-    def test_list_sections_with_config(self, sample_project):
+    async def test_list_sections_with_config(self, readonly_service, readonly_sample_project):
         """Should return sections from workflow_config.json"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
-        sections = service.list_sections(project_name)
+        _, project_name = readonly_sample_project
+        sections = await readonly_service.list_sections(project_name)
 
         assert len(sections) == 2
         assert sections[0].section_id == "section1"
@@ -29,7 +111,7 @@ class TestWorkflowServiceListSections:
         assert sections[1].section_id == "section2"
         assert sections[1].question_count == 1
 
-    def test_list_sections_empty_config(self, temp_projects_dir):
+    async def test_list_sections_empty_config(self, temp_projects_dir):
         """Should return empty list if no sections configured"""
         projects_dir = temp_projects_dir / "projects"
         projects_dir.mkdir()
@@ -37,30 +119,28 @@ class TestWorkflowServiceListSections:
         project_path.mkdir()
 
         # Create empty workflow config
-        with open(project_path / "workflow_config.json", 'w') as f:
-            json.dump({"sections": []}, f)
+        (project_path / "workflow_config.json").write_bytes(orjson.dumps({"sections": []}))
 
-        service = WorkflowService(base_path=str(temp_projects_dir))
-        sections = service.list_sections("empty_project")
+        service = _make_service(str(temp_projects_dir))
+        sections = await service.list_sections("empty_project")
 
         assert sections == []
 
-    def test_list_sections_no_config(self, temp_projects_dir):
+    async def test_list_sections_no_config(self, temp_projects_dir):
         """Should return empty list if no config file"""
         projects_dir = temp_projects_dir / "projects"
         projects_dir.mkdir()
         (projects_dir / "no_config_project").mkdir()
 
-        service = WorkflowService(base_path=str(temp_projects_dir))
-        sections = service.list_sections("no_config_project")
+        service = _make_service(str(temp_projects_dir))
+        sections = await service.list_sections("no_config_project")
 
         assert sections == []
 
-    def test_list_sections_with_completion(self, sample_project_with_results):
+    async def test_list_sections_with_completion(self, service, sample_project_with_results):
         """Should calculate completion percentage correctly"""
-        base_path, project_name = sample_project_with_results
-        service = WorkflowService(base_path=base_path)
-        sections = service.list_sections(project_name)
+        _, project_name = sample_project_with_results
+        sections = await service.list_sections(project_name)
 
         # Section 1 has 2 questions, 1 answered
         section1 = sections[0]
@@ -71,22 +151,20 @@ class TestWorkflowServiceListSections:
 class TestWorkflowServiceGetSection:
     """Tests for WorkflowService.get_section()"""
 
-    def test_get_section_exists(self, sample_project):
+    async def test_get_section_exists(self, readonly_service, readonly_sample_project):
         """Should return section dict for existing section"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
-        section = service.get_section(project_name, "section1")
+        _, project_name = readonly_sample_project
+        section = await readonly_service.get_section(project_name, "section1")
 
         assert section is not None
         assert section["id"] == "section1"
         assert section["name"] == "Test Section 1"
         assert len(section["questions"]) == 2
 
-    def test_get_section_not_exists(self, sample_project):
+    async def test_get_section_not_exists(self, readonly_service, readonly_sample_project):
         """Should return None for non-existent section"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
-        section = service.get_section(project_name, "nonexistent")
+        _, project_name = readonly_sample_project
+        section = await readonly_service.get_section(project_name, "nonexistent")
 
         assert section is None
 
@@ -94,16 +172,15 @@ class TestWorkflowServiceGetSection:
 class TestWorkflowServiceCreateSection:
     """Tests for WorkflowService.create_section()"""
 
-    def test_create_section_success(self, sample_project):
+    async def test_create_section_success(self, service, sample_project):
         """Should create new section in config"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
         section_data = {
             "name": "New Section",
             "template": "Answer based on documents"
         }
-        result = service.create_section(project_name, section_data)
+        result = await service.create_section(project_name, section_data)
 
         assert result is not None
         assert "id" in result
@@ -111,20 +188,19 @@ class TestWorkflowServiceCreateSection:
         assert result["questions"] == []
 
         # Verify persisted
-        sections = service.list_sections(project_name)
+        sections = await service.list_sections(project_name)
         assert len(sections) == 3
 
-    def test_create_section_with_id(self, sample_project):
+    async def test_create_section_with_id(self, service, sample_project):
         """Should use provided ID if given"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
         section_data = {
             "id": "custom_id",
             "name": "Custom Section",
             "template": "Test template"
         }
-        result = service.create_section(project_name, section_data)
+        result = await service.create_section(project_name, section_data)
 
         assert result["id"] == "custom_id"
 
@@ -132,16 +208,15 @@ class TestWorkflowServiceCreateSection:
 class TestWorkflowServiceUpdateSection:
     """Tests for WorkflowService.update_section()"""
 
-    def test_update_section_success(self, sample_project):
+    async def test_update_section_success(self, service, sample_project):
         """Should update section properties"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
         updated_data = {
             "name": "Updated Name",
             "template": "Updated template"
         }
-        result = service.update_section(project_name, "section1", updated_data)
+        result = await service.update_section(project_name, "section1", updated_data)
 
         assert result is not None
         assert result["name"] == "Updated Name"
@@ -149,96 +224,89 @@ class TestWorkflowServiceUpdateSection:
         # Questions should be preserved
         assert len(result["questions"]) == 2
 
-    def test_update_section_not_exists(self, sample_project):
+    async def test_update_section_not_exists(self, service, sample_project):
         """Should return None for non-existent section"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
-        result = service.update_section(project_name, "nonexistent", {"name": "Test"})
+        result = await service.update_section(project_name, "nonexistent", {"name": "Test"})
         assert result is None
 
 
 class TestWorkflowServiceDeleteSection:
     """Tests for WorkflowService.delete_section()"""
 
-    def test_delete_section_success(self, sample_project):
+    async def test_delete_section_success(self, service, sample_project):
         """Should delete section from config"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
-        result = service.delete_section(project_name, "section1")
+        result = await service.delete_section(project_name, "section1")
         assert result is True
 
         # Verify deleted
-        sections = service.list_sections(project_name)
+        sections = await service.list_sections(project_name)
         assert len(sections) == 1
         assert sections[0].section_id == "section2"
 
-    def test_delete_section_not_exists(self, sample_project):
+    async def test_delete_section_not_exists(self, service, sample_project):
         """Should return False for non-existent section"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
-        result = service.delete_section(project_name, "nonexistent")
+        result = await service.delete_section(project_name, "nonexistent")
         assert result is False
 
 
 class TestWorkflowServiceQuestions:
     """Tests for question CRUD operations"""
 
-    def test_get_section_questions(self, sample_project):
+    async def test_get_section_questions(self, readonly_service, readonly_sample_project):
         """Should return questions for section"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = readonly_sample_project
 
-        questions = service.get_section_questions(project_name, "section1")
+        questions = await readonly_service.get_section_questions(project_name, "section1")
         assert len(questions) == 2
         assert questions[0]["id"] == "q1"
         assert questions[0]["question"] == "What is the main topic?"
 
-    def test_add_question_success(self, sample_project):
+    async def test_add_question_success(self, service, sample_project):
         """Should add question to section"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
         question_data = {
             "question": "New question?",
             "instructions": "New instructions"
         }
-        result = service.add_question(project_name, "section1", question_data)
+        result = await service.add_question(project_name, "section1", question_data)
 
         assert result is not None
         assert "id" in result
         assert result["question"] == "New question?"
 
         # Verify persisted
-        questions = service.get_section_questions(project_name, "section1")
+        questions = await service.get_section_questions(project_name, "section1")
         assert len(questions) == 3
 
-    def test_update_question_success(self, sample_project):
+    async def test_update_question_success(self, service, sample_project):
         """Should update existing question"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
         updated_data = {
             "question": "Updated question?",
             "instructions": "Updated instructions"
         }
-        result = service.update_question(project_name, "section1", "q1", updated_data)
+        result = await service.update_question(project_name, "section1", "q1", updated_data)
 
         assert result is not None
         assert result["question"] == "Updated question?"
 
-    def test_delete_question_success(self, sample_project):
+    async def test_delete_question_success(self, service, sample_project):
         """Should delete question from section"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
-        result = service.delete_question(project_name, "section1", "q1")
+        result = await service.delete_question(project_name, "section1", "q1")
         assert result is True
 
         # Verify deleted
-        questions = service.get_section_questions(project_name, "section1")
+        questions = await service.get_section_questions(project_name, "section1")
         assert len(questions) == 1
         assert questions[0]["id"] == "q2"
 
@@ -246,33 +314,30 @@ class TestWorkflowServiceQuestions:
 class TestWorkflowServiceResults:
     """Tests for results-related methods"""
 
-    def test_get_project_results_exists(self, sample_project_with_results):
+    async def test_get_project_results_exists(self, service, sample_project_with_results):
         """Should return results for project"""
-        base_path, project_name = sample_project_with_results
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project_with_results
 
-        results = service.get_project_results(project_name)
+        results = await service.get_project_results(project_name)
         assert results is not None
         assert results.project_id == project_name
         assert results.total_questions == 3  # 2 in section1 + 1 in section2
         assert results.answered_questions == 1
 
-    def test_get_project_results_no_results(self, sample_project):
+    async def test_get_project_results_no_results(self, service, sample_project):
         """Should return None if no results file"""
-        base_path, project_name = sample_project
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project
 
-        results = service.get_project_results(project_name)
+        results = await service.get_project_results(project_name)
         assert results is None
 
-    def test_clear_section_answers(self, sample_project_with_results):
+    async def test_clear_section_answers(self, service, sample_project_with_results):
         """Should clear answers for a section"""
-        base_path, project_name = sample_project_with_results
-        service = WorkflowService(base_path=base_path)
+        _, project_name = sample_project_with_results
 
-        cleared = service.clear_section_answers(project_name, "section1")
+        cleared = await service.clear_section_answers(project_name, "section1")
         assert cleared == 1  # 1 question was answered
 
         # Verify cleared
-        results = service._get_results(project_name)
+        results = await service._get_results(project_name)
         assert results["sections"]["section1"]["questions"] == {}
@@ -15,8 +15,9 @@ No hardcoded domain logic - fully user-configurable via UI.
 
 import os
 import json
+import inspect
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable
 from dotenv import load_dotenv
 
 # Agent Framework imports
@@ -26,10 +27,13 @@ from agent_framework._workflows._agent_executor import AgentExecutorResponse
 
 # Storage service
 from apps.api.app.services.storage_service import get_storage_service
+from scripts.logging_config import get_logger
 
 # Load environment
 load_dotenv()
 
+logger = get_logger(__name__)
+
 # Configuration
 AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY") or os.getenv("AZURE_OPENAI_KEY")
 AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
@@ -213,7 +217,13 @@ Comments: [Any additional context, technical details, or important notes]
 
         return agent
 
-    def create_question_saver(self, section: Dict, question: Dict, question_index: int):
+    def create_question_saver(
+        self,
+        section: Dict,
+        question: Dict,
+        question_index: int,
+        on_question_complete: Optional[Callable[[str], Any]] = None
+    ):
         """
         Create a saver executor that saves the answer immediately after generation.
 
@@ -221,6 +231,7 @@ Comments: [Any additional context, technical details, or important notes]
             section: Section dict
             question: Question dict
             question_index: Index of the question in the section
+            on_question_complete: Optional callback (sync or async) invoked with the question ID once saved
 
         Returns:
             Saver executor
@@ -271,20 +282,16 @@ Comments: [Any additional context, technical details, or important notes]
                     elif current_section == 'comments':
                         comments += ' ' + line_stripped
 
-            # Load existing results from blob storage or create new
-            results = storage.read_json(project_name, "output/results.json")
-            if not results:
-                results = {"sections": {}}
-
-            # Ensure section exists in results
-            if section_id not in results["sections"]:
-                results["sections"][section_id] = {
+            # Load this section's existing results (one small blob) or create new
+            section_results = storage.read_section_results(project_name, section_id)
+            if not section_results:
+                section_results = {
                     "name": section_name,
                     "questions": {}
                 }
 
             # Save question result
-            results["sections"][section_id]["questions"][question_id] = {
+            section_results.setdefault("questions", {})[question_id] = {
                 "question": question_text,
                 "answer": answer,
                 "reference": reference,
@@ -293,10 +300,20 @@ Comments: [Any additional context, technical details, or important notes]
             }
 
             # Write back to blob storage
-            storage.write_json(project_name, "output/results.json", results)
+            storage.write_section_results(project_name, section_id, section_results)
 
             print(f"[SAVER] Saved {section_id}/{question_id}: {answer[:50]}...")
 
+            # Notify listeners (e.g. WorkflowService progress) without them polling results
+            if on_question_complete:
+                try:
+                    outcome = on_question_complete(question_id)
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception as e:
+                    # Progress reporting must never fail the run; the answer is already saved
+                    logger.warning(f"Progress callback failed for {section_id}/{question_id}: {e}")
+
             # Run evaluation on the answer (async-safe, non-blocking for UI)
             try:
                 from scripts.evaluation.evaluate_results import evaluate_single_answer
@@ -310,10 +327,10 @@ Comments: [Any additional context, technical details, or important notes]
                 )
 
                 # Re-read results to avoid race conditions
-                results = storage.read_json(project_name, "output/results.json")
-                if results and section_id in results.get("sections", {}):
-                    results["sections"][section_id]["questions"][question_id]["evaluation"] = eval_result
-                    storage.write_json(project_name, "output/results.json", results)
+                section_results = storage.read_section_results(project_name, section_id)
+                if section_results and question_id in section_results.get("questions", {}):
+                    section_results["questions"][question_id]["evaluation"] = eval_result
+                    storage.write_section_results(project_name, section_id, section_results)
 
                 avg_score = eval_result.get("average_score", "N/A")
                 print(f"[EVAL] {section_id}/{question_id} average score: {avg_score}")
@@ -325,12 +342,17 @@ Comments: [Any additional context, technical details, or important notes]
 
         return question_saver
 
-    def build_section_workflow(self, section_id: str):
+    def build_section_workflow(
+        self,
+        section_id: str,
+        on_question_complete: Optional[Callable[[str], Any]] = None
+    ):
         """
         Build a workflow for a specific section.
 
         Args:
             section_id: ID of the section to build workflow for
+            on_question_complete: Optional callback invoked with each question ID after its answer is saved
 
         Returns:
             Workflow object
@@ -360,7 +382,7 @@ Comments: [Any additional context, technical details, or important notes]
 
         for i, question in enumerate(questions):
             agent = self.create_question_agent(section, question)
-            saver = self.create_question_saver(section, question, i)
+            saver = self.create_question_saver(section, question, i, on_question_complete)
             agents.append(agent)
             savers.append(saver)
             print(f"  Created Q{i+1}: {question.get('question', '')[:50]}...")
@@ -375,7 +397,7 @@ SECTION COMPLETE: {section_name}
 {'='*80}
 All {len(questions)} questions have been answered and saved.
 
-Results saved to blob storage: {self.project_name}/output/results.json
+Results saved to blob storage: {self.project_name}/output/results/{section_id}.json
 """
             await ctx.yield_output(completion_msg)
 